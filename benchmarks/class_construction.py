@@ -0,0 +1,51 @@
+import time
+import tracemalloc
+from collections.abc import Callable
+from itertools import count
+
+from benchmarks.results import ClassConstructionResult
+from benchmarks.schemas import build_sqlalchemy_pairs, build_sqlmodel_pairs
+
+BUILDERS: dict[str, Callable[[int, int, str], list]] = {
+    "sqlalchemy": build_sqlalchemy_pairs,
+    "sqlmodel": build_sqlmodel_pairs,
+}
+
+# Class and table names must stay unique across runs since SQLModel shares one registry.
+_RUN_IDS = count()
+
+
+def measure_class_construction(framework: str, models: int, fields: int) -> ClassConstructionResult:
+    """
+    Time building `models` draft/complete pairs and record the memory they allocate.
+
+    Tracing allocations slows class construction down, so the time and the
+    memory are measured on two separate builds.
+    """
+
+    build = BUILDERS[framework]
+
+    started = time.perf_counter()
+    pairs = build(models, fields, f"{framework}{next(_RUN_IDS)}")
+    seconds = time.perf_counter() - started
+
+    del pairs
+
+    tracemalloc.start()
+    try:
+        pairs = build(models, fields, f"{framework}{next(_RUN_IDS)}")
+        allocated, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del pairs
+
+    return ClassConstructionResult(
+        framework=framework,
+        models=models,
+        fields=fields,
+        seconds=seconds,
+        seconds_per_model=seconds / models,
+        allocated_bytes=allocated,
+        peak_bytes=peak,
+    )
@@ -0,0 +1,110 @@
+import time
+from collections.abc import Callable, Iterator
+from typing import Final
+
+from sqlalchemy import Engine, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.results import DataOperationResult
+from benchmarks.schemas import build_sqlalchemy_pairs
+from partial_tables import PromotionMode, diff_drafts, promote, promote_in_batches
+
+FIELDS: Final[int] = 8
+INSERT_CHUNK_SIZE: Final[int] = 10_000
+PROMOTION_BATCH_SIZE: Final[int] = 10_000
+
+# One row in INCOMPLETE_EVERY is left missing a field so filtering has something to skip.
+INCOMPLETE_EVERY: Final[int] = 10
+
+
+def _draft_rows(rows: int) -> Iterator[list[dict[str, object]]]:
+    """Yield the draft rows to seed in chunks of INSERT_CHUNK_SIZE."""
+
+    for start in range(0, rows, INSERT_CHUNK_SIZE):
+        yield [
+            {"id": key, "name": f"business {key}"}
+            | {
+                f"field_{field}": None if field == 0 and key % INCOMPLETE_EVERY == 0 else f"value {key}"
+                for field in range(FIELDS)
+            }
+            for key in range(start, min(start + INSERT_CHUNK_SIZE, rows))
+        ]
+
+
+def _timed(database: str, rows: int, operation: str, run: Callable[[], object]) -> DataOperationResult:
+    """Run one operation and record how long it took."""
+
+    started = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - started
+
+    return DataOperationResult(
+        database=database,
+        rows=rows,
+        operation=operation,
+        seconds=seconds,
+        rows_per_second=rows / seconds if seconds else 0.0,
+    )
+
+
+def measure_data_operations(engine: Engine, database: str, rows: int) -> list[DataOperationResult]:
+    """Seed a draft table with `rows` rows and time completeness filtering, promotion and diffing."""
+
+    ((draft, complete),) = build_sqlalchemy_pairs(1, FIELDS, f"bench_{rows}")
+    metadata = draft.metadata
+
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    try:
+        with Session(engine) as session:
+            results = [
+                _timed(
+                    database,
+                    rows,
+                    "seed_drafts",
+                    lambda: [session.execute(insert(draft), chunk) for chunk in _draft_rows(rows)],
+                )
+            ]
+            session.commit()
+
+            results.append(
+                _timed(
+                    database,
+                    rows,
+                    "count_complete",
+                    lambda: session.scalar(select(func.count()).select_from(draft).where(draft.is_complete)),
+                )
+            )
+            results.append(_timed(database, rows, "promote", lambda: promote(session, draft, complete)))
+            session.commit()
+
+            results.append(
+                _timed(
+                    database,
+                    rows,
+                    "promote_upsert_unchanged",
+                    lambda: promote(session, draft, complete, mode=PromotionMode.UPSERT),
+                )
+            )
+            session.commit()
+
+            results.append(
+                _timed(database, rows, "diff_drafts", lambda: diff_drafts(session, draft, complete))
+            )
+
+            session.execute(delete(complete))
+            session.commit()
+
+            results.append(
+                _timed(
+                    database,
+                    rows,
+                    "promote_in_batches",
+                    lambda: promote_in_batches(session, draft, complete, batch_size=PROMOTION_BATCH_SIZE),
+                )
+            )
+    finally:
+        metadata.drop_all(engine)
+
+    return results
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+
+
+class EnvironmentInfo(BaseModel):
+    """Versions the benchmark ran with."""
+
+    python: str
+    platform: str
+    sqlalchemy: str
+    sqlmodel: str
+
+
+class ClassConstructionResult(BaseModel):
+    """Cost of building draft/complete model pairs with one of the mixins."""
+
+    framework: str
+    models: int
+    fields: int
+    seconds: float
+    seconds_per_model: float
+    # Memory still allocated once the classes are built, and the peak while building them.
+    allocated_bytes: int
+    peak_bytes: int
+
+
+class DataOperationResult(BaseModel):
+    """Time one data operation took against a draft table of a given size."""
+
+    database: str
+    rows: int
+    operation: str
+    seconds: float
+    rows_per_second: float
+
+
+class BenchmarkReport(BaseModel):
+    """Every result of one benchmark run."""
+
+    environment: EnvironmentInfo
+    class_construction: list[ClassConstructionResult]
+    data_operations: list[DataOperationResult]
@@ -0,0 +1,68 @@
+import types
+from typing import Annotated
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlmodel import Field, SQLModel
+
+from partial_tables import PartialAllowed, PartialSQLAlchemyMixin, PartialSQLModelMixin, PartialTable
+
+PartialStr = Annotated[str, PartialAllowed()]
+
+
+def build_sqlalchemy_pairs(
+    models: int, fields: int, prefix: str
+) -> list[tuple[type[PartialTable], type[DeclarativeBase]]]:
+    """Build `models` draft/complete pairs with `fields` PartialAllowed columns each."""
+
+    class Base(DeclarativeBase):
+        pass
+
+    pairs = []
+
+    for index in range(models):
+        namespace = {
+            "__abstract__": True,
+            "__annotations__": {"id": Mapped[int], "name": Mapped[str]}
+            | {f"field_{field}": Mapped[PartialStr] for field in range(fields)},
+            "id": mapped_column(primary_key=True),
+            "name": mapped_column(),
+        } | {f"field_{field}": mapped_column() for field in range(fields)}
+        base = type(f"{prefix}Base{index}", (PartialSQLAlchemyMixin, Base), namespace)
+        draft = type(
+            f"{prefix}Draft{index}", (base, PartialTable), {"__tablename__": f"{prefix}_draft_{index}"}
+        )
+        complete = type(f"{prefix}Complete{index}", (base,), {"__tablename__": f"{prefix}_complete_{index}"})
+        pairs.append((draft, complete))
+
+    return pairs
+
+
+def build_sqlmodel_pairs(
+    models: int, fields: int, prefix: str
+) -> list[tuple[type[PartialTable], type[SQLModel]]]:
+    """Build `models` SQLModel draft/complete pairs with `fields` PartialAllowed columns each."""
+
+    pairs = []
+
+    for index in range(models):
+        namespace = {
+            "__annotations__": {"id": int, "name": str}
+            | {f"field_{field}": PartialStr for field in range(fields)},
+            "id": Field(primary_key=True),
+        } | {f"field_{field}": Field() for field in range(fields)}
+        base = type(f"{prefix}Base{index}", (PartialSQLModelMixin, SQLModel), namespace)
+        draft = types.new_class(
+            f"{prefix}Draft{index}",
+            (base, PartialTable),
+            {"table": True},
+            lambda ns, index=index: ns.update(__tablename__=f"{prefix}_draft_{index}"),
+        )
+        complete = types.new_class(
+            f"{prefix}Complete{index}",
+            (base,),
+            {"table": True},
+            lambda ns, index=index: ns.update(__tablename__=f"{prefix}_complete_{index}"),
+        )
+        pairs.append((draft, complete))
+
+    return pairs
@@ -1,6 +1,45 @@
+from .annotations import PartialAllowed
 from .partial_table import (
-    PartialAllowed,
     PartialTable,
     PartialSQLAlchemyMixin,
     PartialSQLModelMixin,
 )
+from .cache import LookupCache, lookup_cache
+from .checkout import async_checkout, checkout
+from .columnar import (
+    async_iter_arrow_batches,
+    async_iter_numpy_batches,
+    iter_arrow_batches,
+    iter_numpy_batches,
+)
+from .completeness import CompletenessChecker, completeness_checker
+from .diff import async_diff_drafts, diff_drafts
+from .factory import make_partial
+from .ingest import async_ingest_drafts, ingest_drafts
+from .models import (
+    CacheStats,
+    CheckoutResult,
+    CompletionReport,
+    DiffReport,
+    DraftDiff,
+    FieldCompletion,
+    NumpyBatch,
+    PartialPartition,
+    PartialPartitioning,
+    PartialStorage,
+    PartitionMethod,
+    PromotionMode,
+    PromotionProgress,
+    PromotionResult,
+)
+from .partitioning import async_create_partitions, create_partitions, partition_clause
+from .promotion import (
+    async_promote,
+    async_promote_claimed,
+    async_promote_in_batches,
+    promote,
+    promote_claimed,
+    promote_in_batches,
+)
+from .stats import async_completion_stats, completion_stats
+from .submission import submit_for_promotion
@@ -0,0 +1,189 @@
+import functools
+import re
+import sys
+from typing import Annotated, Final, Optional, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+if sys.version_info >= (3, 14):
+    from annotationlib import (
+        Format,
+        call_annotate_function,
+        get_annotate_from_class_namespace,
+        get_annotations,
+    )
+
+# Stored in the rewrite cache for annotations that need no rewrite, so that an equal
+# but distinct annotation is handed back as-is and keeps its identity.
+_UNCHANGED: Final[object] = object()
+
+# Distinct annotations whose rewrite is kept; classes keep their own in _HINT_REWRITE_CACHE.
+_REWRITE_CACHE_SIZE: Final[int] = 1024
+
+# Class -> {name of an annotation it declares: rewritten annotation, or None if unchanged}.
+_HINT_REWRITE_CACHE: Final[WeakKeyDictionary[type, dict[str, object | None]]] = WeakKeyDictionary()
+
+# Names whose presence in a string annotation means it may carry PartialAllowed.
+_PARTIAL_MARKER_NAMES: Final[frozenset[str]] = frozenset({"Annotated", "PartialAllowed"})
+
+# A name, or a dotted name such as types.PartialStr.
+_IDENTIFIER_PATTERN: Final[re.Pattern[str]] = re.compile(r"[A-Za-z_]\w*(?:\s*\.\s*[A-Za-z_]\w*)*")
+
+
+class PartialAllowed:
+    """Marker for fields that can be nullable"""
+
+
+def rewrite_with_optional(a: object) -> object:
+    try:
+        hash(a)
+    except TypeError:
+        # Annotated metadata may be unhashable; such annotations are rewritten every time.
+        return _rewrite_annotation(a)
+
+    cached = _cached_rewrite(a)
+
+    return a if cached is _UNCHANGED else cached
+
+
+@functools.lru_cache(maxsize=_REWRITE_CACHE_SIZE)
+def _cached_rewrite(a: object) -> object:
+    new_a = _rewrite_annotation(a)
+
+    return _UNCHANGED if new_a is a else new_a
+
+
+def _rewrite_annotation(a: object) -> object:
+    origin = get_origin(a)
+
+    if origin is Annotated:
+        base, *meta = get_args(a)
+
+        if any(isinstance(m, PartialAllowed) for m in meta):
+            return Annotated[Optional[base], *meta]
+
+        new_base = rewrite_with_optional(base)
+
+        if new_base is not base:
+            return Annotated[new_base, *meta]
+
+        return a
+
+    args = get_args(a)
+
+    if not args:
+        return a
+
+    new_args = tuple(rewrite_with_optional(x) for x in args)
+
+    if new_args != args and origin is not None and hasattr(origin, "__class_getitem__"):
+        # Avoid passing a single-element tuple which would produce origin[(T,)].
+        param = new_args[0] if len(new_args) == 1 else new_args
+
+        return origin[param]  # type: ignore[index]
+
+    return a
+
+
+def _declared_annotations(klass: type) -> dict[str, object]:
+    """Return the annotations a class declares itself, without evaluating deferred ones."""
+
+    namespace = klass.__dict__
+
+    # __annotations_cache__ holds annotations that Python 3.14+ already evaluated or that were assigned.
+    for key in ("__annotations__", "__annotations_cache__"):
+        annotations = namespace.get(key)
+
+        if isinstance(annotations, dict):
+            return annotations
+
+    if sys.version_info >= (3, 14):
+        annotate = get_annotate_from_class_namespace(namespace)
+
+        if annotate is not None:
+            return call_annotate_function(annotate, Format.STRING)
+
+    return {}
+
+
+def _module_namespace(klass: type) -> dict[str, object]:
+    return getattr(sys.modules.get(klass.__module__), "__dict__", {})
+
+
+def _may_carry_partial(klass: type, value: object) -> bool:
+    """Cheaply tell whether an annotation may carry PartialAllowed without evaluating it."""
+
+    if not isinstance(value, str):
+        return True
+
+    namespaces = (klass.__dict__, _module_namespace(klass))
+
+    for token in _IDENTIFIER_PATTERN.findall(value):
+        head, *attributes = (part.strip() for part in token.split("."))
+
+        if _PARTIAL_MARKER_NAMES.intersection((head, *attributes)):
+            return True
+
+        # A type alias such as PartialStr = Annotated[str, PartialAllowed()], possibly module
+        # qualified as in types.PartialStr. Names that don't resolve can't be such an alias.
+        alias = next((namespace[head] for namespace in namespaces if head in namespace), None)
+
+        for attribute in attributes:
+            alias = getattr(alias, attribute, None)
+
+        if get_origin(alias) is not None and rewrite_with_optional(alias) is not alias:
+            return True
+
+    return False
+
+
+def _evaluate_annotation(klass: type, name: str, value: object) -> object:
+    if not isinstance(value, str):
+        return value
+
+    if sys.version_info >= (3, 14):
+        value = get_annotations(klass, format=Format.FORWARDREF)[name]
+
+        if not isinstance(value, str):
+            return value
+
+    # Same namespaces as typing.get_type_hints uses for class annotations.
+    # pylint: disable-next=eval-used
+    return eval(value, dict(vars(klass)), _module_namespace(klass))
+
+
+def declared_rewrites(klass: type) -> dict[str, object | None]:
+    rewrites = _HINT_REWRITE_CACHE.get(klass)
+
+    if rewrites is None:
+        rewrites = {}
+
+        for name, value in _declared_annotations(klass).items():
+            new_ann = None
+
+            if _may_carry_partial(klass, value):
+                ann = _evaluate_annotation(klass, name, value)
+                new_ann = rewrite_with_optional(ann)
+                new_ann = None if new_ann is ann else new_ann
+
+            rewrites[name] = new_ann
+
+        _HINT_REWRITE_CACHE[klass] = rewrites
+
+    return rewrites
+
+
+def rewrite_type_hints(cls: type) -> dict[str, object]:
+    """
+    Return the rewritten annotation of every field of cls that rewrite_with_optional changed.
+
+    Each class in the MRO only inspects the annotations it declares itself, and only
+    evaluates the ones that may carry PartialAllowed. The result is cached per class,
+    so partial tables sharing a base reuse the base's work.
+    """
+
+    rewrites: dict[str, object | None] = {}
+
+    for klass in reversed(cls.__mro__):
+        rewrites.update(declared_rewrites(klass))
+
+    return {name: ann for name, ann in rewrites.items() if ann is not None}
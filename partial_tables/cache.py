@@ -0,0 +1,322 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Final, TypeAlias
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Table, event, inspect
+from sqlalchemy.engine import Connection, Result
+from sqlalchemy.ext.mutable import MutableBase
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from partial_tables.models.cache import CacheStats
+from partial_tables.pairing import model_table
+from partial_tables.partial_table import PartialTable
+
+PrimaryKey: TypeAlias = tuple[object, ...]
+
+# session.info key: table -> primary keys of the rows the session wrote since its
+# transaction began, or None when it may have written any row.
+_PENDING_KEYS: Final[str] = "partial_tables_lookup_cache_pending"
+
+_LOOKUP_CACHES: Final[WeakKeyDictionary[type, "LookupCache"]] = WeakKeyDictionary()
+
+# Guards attaching caches, so that listeners are only installed once.
+_LOOKUP_CACHES_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class LookupCache:
+    """
+    In-process read-through cache of primary key lookups on a complete table.
+
+    Entries hold the column values of a row and are evicted in least recently
+    used order once maxsize is reached, or when they are older than ttl seconds.
+    When a session commits writes to the table, the rows it wrote are evicted:
+    promotions and DML statements run with the session evict the rows they
+    returned, ORM flushes evict the flushed rows, and any other DML statement
+    on the table clears the cache. A lookup that raced with such a commit is
+    not stored. Writes that bypass the Session are not seen. Every instance
+    returned from the cache gets its own copy of the cached values.
+    """
+
+    def __init__(self, model: type, maxsize: int, ttl: float | None):
+        self.model = model
+        self.table = model_table(model)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._mapper = inspect(model)
+        self._names = tuple(attr.key for attr in self._mapper.column_attrs)
+        self._entries: OrderedDict[PrimaryKey, tuple[float | None, tuple[object, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every eviction by a write, so lookups that started before it are not stored.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, session: Session, key: object) -> object | None:
+        """Return the row with primary key `key` as an instance in session, like Session.get()."""
+
+        key = _primary_key(key)
+
+        if self._in_session(session, key):
+            return session.get(self.model, key)
+
+        values, generation = self._lookup(session, key)
+
+        if values is not None:
+            return self._attach(session, values)
+
+        instance = session.get(self.model, key)
+        self._store(session, key, instance, generation)
+
+        return instance
+
+    async def async_get(self, session: AsyncSession, key: object) -> object | None:
+        """Async version of get()."""
+
+        key = _primary_key(key)
+
+        if self._in_session(session.sync_session, key):
+            return await session.get(self.model, key)
+
+        values, generation = self._lookup(session.sync_session, key)
+
+        if values is not None:
+            return self._attach(session.sync_session, values)
+
+        instance = await session.get(self.model, key)
+        self._store(session.sync_session, key, instance, generation)
+
+        return instance
+
+    def invalidate(self, keys: Iterable[PrimaryKey] | None = None) -> None:
+        """Evict the given primary keys, or every entry when keys is None."""
+
+        with self._lock:
+            self._generation += 1
+
+            if keys is None:
+                self._evictions += len(self._entries)
+                self._entries.clear()
+                return
+
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the hit, miss and eviction counters of the cache."""
+
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions, size=len(self._entries)
+            )
+
+    def _in_session(self, session: Session, key: PrimaryKey) -> bool:
+        # The session's own instance wins, whether it is current, expired or modified.
+        return self._mapper.identity_key_from_primary_key(key) in session.identity_map
+
+    def _written(self, session: Session, key: PrimaryKey) -> bool:
+        """Whether session wrote the row in its current transaction."""
+
+        pending = session.info.get(_PENDING_KEYS, {})
+
+        return self.table in pending and (pending[self.table] is None or key in pending[self.table])
+
+    def _lookup(self, session: Session, key: PrimaryKey) -> tuple[tuple[object, ...] | None, int]:
+        # A session must see its own uncommitted writes, and must not share them.
+        written = self._written(session, key)
+
+        with self._lock:
+            if written:
+                self._misses += 1
+                return None, -1
+
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._evictions += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None, self._generation
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry[1], self._generation
+
+    def _store(self, session: Session, key: PrimaryKey, instance: object | None, generation: int) -> None:
+        if instance is None:
+            return
+
+        state = inspect(instance)
+
+        # Only committed values of fully loaded rows are shared with other sessions.
+        if (
+            state.modified
+            or self._written(session, key)
+            or any(name not in state.dict for name in self._names)
+        ):
+            return
+
+        # Copied so that mutating a JSON or ARRAY value of the instance leaves the entry alone.
+        values = copy.deepcopy(tuple(state.dict[name] for name in self._names))
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries[key] = (expires, values)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _attach(self, session: Session, values: tuple[object, ...]) -> object:
+        """Build a persistent instance from cached values without querying the database."""
+
+        instance = self._mapper.class_manager.new_instance()
+        state = inspect(instance)
+
+        # Every instance gets its own copy of the values, which are shared by every session.
+        for name, value in zip(self._names, copy.deepcopy(values)):
+            set_committed_value(instance, name, value)
+
+            # Mutation tracking is attached when a row is loaded, which a cache hit skips.
+            if isinstance(value, MutableBase):
+                # pylint: disable-next=protected-access
+                value._parents[state] = name
+
+        make_transient_to_detached(instance)
+        session.add(instance)
+
+        return instance
+
+
+def _primary_key(key: object) -> PrimaryKey:
+    return tuple(key) if isinstance(key, (tuple, list)) else (key,)
+
+
+def caches_of(table: object) -> list[LookupCache]:
+    """Return the lookup caches attached to the model of table."""
+
+    return [cache for cache in list(_LOOKUP_CACHES.values()) if cache.table is table]
+
+
+def _mark_pending(session: Session | None, table: Table, keys: Iterable[PrimaryKey] | None) -> None:
+    if session is None:
+        return
+
+    pending = session.info.setdefault(_PENDING_KEYS, {})
+
+    if keys is None:
+        pending[table] = None
+    elif table not in pending:
+        pending[table] = set(keys)
+    elif pending[table] is not None:
+        pending[table].update(keys)
+
+
+def _track_flush(mapper: Mapper, _connection: Connection, target: object) -> None:
+    state = inspect(target)
+    # A flush that changed the primary key leaves the old key stale as well.
+    keys = {tuple(mapper.primary_key_from_instance(target))}
+
+    if state.key is not None:
+        keys.add(tuple(state.key[1]))
+
+    _mark_pending(object_session(target), model_table(mapper.class_), keys)
+
+
+def _track_statement(orm_execute_state: ORMExecuteState) -> Result | None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+
+    statement = orm_execute_state.statement
+    mapper = orm_execute_state.bind_mapper
+    # ORM enabled statements target an annotated copy of the mapped table.
+    table = getattr(statement, "table", None) if mapper is None else model_table(mapper.class_)
+
+    if not caches_of(table):
+        return None
+
+    pk_columns = list(table.primary_key.columns)
+    returned = [description["expr"] for description in statement.returning_column_descriptions]
+
+    # Statements returning the primary key first, like promotions, evict exactly the rows they wrote.
+    if len(returned) >= len(pk_columns) and all(a is b for a, b in zip(returned, pk_columns)):
+        frozen = orm_execute_state.invoke_statement().freeze()
+        _mark_pending(
+            orm_execute_state.session, table, (tuple(row[: len(pk_columns)]) for row in frozen.data)
+        )
+
+        return frozen()
+
+    _mark_pending(orm_execute_state.session, table, None)
+
+    return None
+
+
+def _evict_pending(session: Session) -> None:
+    # Rolled back writes are evicted too, as a rolled back savepoint may hide earlier writes.
+    for table, keys in session.info.pop(_PENDING_KEYS, {}).items():
+        for cache in caches_of(table):
+            cache.invalidate(keys)
+
+
+def lookup_cache(complete_model: type, maxsize: int = 1024, ttl: float | None = None) -> LookupCache:
+    """
+    Return the read-through primary key cache of a complete table, attaching it on first use.
+
+    maxsize and ttl only apply to the call that attaches the cache. The cache is
+    shared by every session and thread of the process.
+    """
+
+    cache = _LOOKUP_CACHES.get(complete_model)
+
+    if cache is not None:
+        return cache
+
+    if issubclass(complete_model, PartialTable):
+        raise ValueError(f"{complete_model.__name__} is a PartialTable and cannot be cached")
+
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+
+    if ttl is not None and ttl <= 0:
+        raise ValueError("ttl must be greater than 0")
+
+    with _LOOKUP_CACHES_LOCK:
+        cache = _LOOKUP_CACHES.get(complete_model)
+
+        if cache is None:
+            cache = LookupCache(complete_model, maxsize, ttl)
+            _LOOKUP_CACHES[complete_model] = cache
+
+            event.listen(complete_model, "after_update", _track_flush, propagate=True)
+            event.listen(complete_model, "after_delete", _track_flush, propagate=True)
+
+            if not event.contains(Session, "do_orm_execute", _track_statement):
+                event.listen(Session, "do_orm_execute", _track_statement)
+                event.listen(Session, "after_commit", _evict_pending)
+                event.listen(Session, "after_rollback", _evict_pending)
+
+    return cache
@@ -0,0 +1,127 @@
+from sqlalchemy import BigInteger, ColumnElement, Insert, and_, func, literal, select, true, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from partial_tables.execution import COMMIT, Steps, async_run_steps, run_steps
+from partial_tables.models.checkout import CheckoutResult
+from partial_tables.pairing import model_table, paired_column_names
+from partial_tables.partial_table import FILLED_MASK_COLUMN, PartialTable
+
+
+def _checkout_statement(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    scope: ColumnElement[bool],
+) -> Insert:
+    """Build an INSERT ... SELECT ... ON CONFLICT DO NOTHING from the complete into the draft table."""
+
+    names = paired_column_names(draft_model, complete_model)
+    draft_table = model_table(draft_model)
+    complete_table = model_table(complete_model)
+
+    if dialect == "postgresql":
+        statement = postgresql.insert(draft_table)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(draft_table)
+    else:
+        raise ValueError(f"Checkout is not supported on {dialect}")
+
+    columns = [complete_table.c[name] for name in names]
+
+    if FILLED_MASK_COLUMN in draft_table.c:
+        # Published rows have every PartialAllowed field filled.
+        names = [*names, FILLED_MASK_COLUMN]
+        columns.append(literal((1 << len(draft_model.__partial_fields__)) - 1, BigInteger))
+
+    rows = select(*columns).where(scope)
+    pk_names = [col.key for col in draft_table.primary_key.columns]
+
+    return statement.from_select([draft_table.c[name] for name in names], rows).on_conflict_do_nothing(
+        index_elements=pk_names
+    )
+
+
+def _checkout_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None,
+    batch_size: int | None,
+) -> Steps[CheckoutResult]:
+    complete_table = model_table(complete_model)
+    scope = true() if where is None else where
+
+    if batch_size is None:
+        candidates = (yield select(func.count()).select_from(complete_table).where(scope)).scalar_one()
+        checked_out = (yield _checkout_statement(dialect, draft_model, complete_model, scope)).rowcount
+
+        return CheckoutResult(checked_out=checked_out, existing=candidates - checked_out)
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    pk_columns = list(complete_table.primary_key.columns)
+    key = tuple_(*pk_columns)
+    last_key = None
+    totals = CheckoutResult(checked_out=0, existing=0)
+
+    while True:
+        batch_scope = scope if last_key is None else and_(scope, key > tuple_(*last_key))
+        batch = select(*pk_columns).where(batch_scope).order_by(*pk_columns).limit(batch_size).subquery()
+        upper = (yield select(*batch.c).order_by(*(c.desc() for c in batch.c)).limit(1)).first()
+
+        if upper is None:
+            break
+
+        candidates = (yield select(func.count()).select_from(batch)).scalar_one()
+        statement = _checkout_statement(
+            dialect, draft_model, complete_model, and_(batch_scope, key <= tuple_(*upper))
+        )
+        checked_out = (yield statement).rowcount
+        yield COMMIT
+
+        last_key = tuple(upper)
+        totals = CheckoutResult(
+            checked_out=totals.checked_out + checked_out,
+            existing=totals.existing + candidates - checked_out,
+        )
+
+    return totals
+
+
+def checkout(
+    session: Session,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int | None = None,
+) -> CheckoutResult:
+    """
+    Open published rows for editing by copying them into the draft table.
+
+    This is the reverse of promote(): a set-based INSERT ... SELECT from the
+    complete table, where published rows that already have a draft are left
+    alone with ON CONFLICT DO NOTHING. Without batch_size, a single statement is
+    run and committing is up to the caller. With batch_size, rows are copied in
+    primary key order batches, with a commit after each batch.
+    """
+
+    steps = _checkout_steps(session.get_bind().dialect.name, draft_model, complete_model, where, batch_size)
+
+    return run_steps(session, steps)
+
+
+async def async_checkout(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int | None = None,
+) -> CheckoutResult:
+    """Async version of checkout()."""
+
+    steps = _checkout_steps(session.get_bind().dialect.name, draft_model, complete_model, where, batch_size)
+
+    return await async_run_steps(session, steps)
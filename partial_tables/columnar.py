@@ -0,0 +1,227 @@
+import datetime
+from collections.abc import AsyncIterator, Iterator, Sequence
+from functools import reduce
+from typing import Final
+
+from sqlalchemy import Column, ColumnElement, DateTime, Enum, Select, TypeDecorator, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.types import TypeEngine
+
+from partial_tables.models.columnar import NumpyBatch
+from partial_tables.pairing import model_table
+from partial_tables.partial_table import IS_COMPLETE_COLUMN, PartialTable
+
+try:
+    import numpy as np
+except ImportError:
+    # pylint: disable-next=invalid-name
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    # pylint: disable-next=invalid-name
+    pa = pc = None
+
+DEFAULT_CHUNK_SIZE: Final[int] = 10_000
+
+# Python type of a column -> NumPy dtype; any other type is kept as object.
+_NUMPY_DTYPES: Final[dict[type, str]] = {int: "int64", float: "float64", bool: "bool"}
+
+
+def _column_type(column: Column) -> TypeEngine:
+    # Decorated types such as SQLModel's AutoString only know the type they wrap.
+    if isinstance(column.type, TypeDecorator):
+        return column.type.impl_instance
+
+    return column.type
+
+
+def _python_type(column: Column) -> type | None:
+    try:
+        return _column_type(column).python_type
+    except NotImplementedError:
+        return None
+
+
+def _enum_labels(column: Column) -> dict[object, str] | None:
+    """Return the label SQLAlchemy stores for each member of an Enum column's enum class."""
+
+    column_type = _column_type(column)
+
+    if not isinstance(column_type, Enum) or column_type.enum_class is None:
+        return None
+
+    # enums holds the names, or what values_callable returned, in member order; aliases are members too.
+    return dict(zip(column_type.enum_class, column_type.enums))
+
+
+def _arrow_type(column: Column) -> "pa.DataType | None":
+    """Return the Arrow type of a column so that every batch has the same schema."""
+
+    types = {
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        str: pa.string(),
+        bytes: pa.binary(),
+        datetime.datetime: pa.timestamp("us"),
+        datetime.date: pa.date32(),
+    }
+
+    column_type = _column_type(column)
+
+    # Enum members are exported as the labels they are stored as.
+    if isinstance(column_type, Enum):
+        return pa.string()
+
+    # Timezone aware values are normalized to UTC rather than losing their offset.
+    if isinstance(column_type, DateTime) and column_type.timezone:
+        return pa.timestamp("us", tz="UTC")
+
+    # None lets Arrow infer the type from the values.
+    return types.get(_python_type(column))
+
+
+def _export_statement(
+    draft_model: type[PartialTable], where: ColumnElement[bool] | None, chunk_size: int
+) -> Select:
+    if not issubclass(draft_model, PartialTable):
+        raise ValueError(f"{draft_model.__name__} is not a PartialTable")
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    # yield_per streams the rows through a server-side cursor, chunk_size rows at a time.
+    return (
+        select(*model_table(draft_model).columns)
+        .where(true() if where is None else where)
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def _arrow_batch(draft_model: type[PartialTable], rows: Sequence[Sequence[object]]) -> "pa.RecordBatch":
+    table = model_table(draft_model)
+    arrays = {}
+
+    for column, values in zip(table.columns, zip(*rows)):
+        labels = _enum_labels(column)
+
+        if labels is not None:
+            values = [None if value is None else labels[value] for value in values]
+
+        arrays[column.key] = pa.array(values, type=_arrow_type(column))
+
+    if IS_COMPLETE_COLUMN not in arrays:
+        arrays[IS_COMPLETE_COLUMN] = reduce(
+            pc.and_,
+            (arrays[name].is_valid() for name in draft_model.__partial_fields__),
+            pa.nulls(len(rows), pa.bool_()).fill_null(True),
+        )
+
+    return pa.RecordBatch.from_pydict(arrays)
+
+
+def _numpy_batch(draft_model: type[PartialTable], rows: Sequence[Sequence[object]]) -> NumpyBatch:
+    table = model_table(draft_model)
+    columns = {}
+    valid = {}
+
+    for column, values in zip(table.columns, zip(*rows)):
+        dtype = _NUMPY_DTYPES.get(_python_type(column), "object")
+        array = np.array(values, dtype="object")
+
+        if column.nullable:
+            valid[column.key] = np.not_equal(array, None)
+
+            if dtype != "object":
+                array[~valid[column.key]] = 0
+
+        columns[column.key] = array.astype(dtype)
+
+    complete = reduce(
+        np.logical_and,
+        (valid[name] for name in draft_model.__partial_fields__),
+        np.ones(len(rows), dtype="bool"),
+    )
+
+    return NumpyBatch(columns=columns, valid=valid, complete=complete)
+
+
+def _require(module: object, name: str, extra: str) -> None:
+    if module is None:
+        raise ImportError(f"{name} is required for this export; install partial-tables[{extra}]")
+
+
+def iter_arrow_batches(
+    session: Session,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Stream a partial table as Arrow record batches of at most chunk_size rows.
+
+    Rows are read through a server-side cursor and converted column by column
+    without building ORM objects. Each batch has the table's columns, whose null
+    bitmaps mark missing values, and an is_complete column derived from them when
+    the table does not store one.
+    """
+
+    _require(pa, "pyarrow", "arrow")
+    result = session.execute(_export_statement(draft_model, where, chunk_size))
+
+    for rows in result.partitions():
+        yield _arrow_batch(draft_model, rows)
+
+
+def iter_numpy_batches(
+    session: Session,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[NumpyBatch]:
+    """
+    Stream a partial table as NumPy arrays of at most chunk_size rows.
+
+    Like iter_arrow_batches(), but each batch holds one array per column, a
+    validity mask per nullable column and the completeness mask of the rows.
+    """
+
+    _require(np, "numpy", "numpy")
+    result = session.execute(_export_statement(draft_model, where, chunk_size))
+
+    for rows in result.partitions():
+        yield _numpy_batch(draft_model, rows)
+
+
+async def async_iter_arrow_batches(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator["pa.RecordBatch"]:
+    """Async version of iter_arrow_batches()."""
+
+    _require(pa, "pyarrow", "arrow")
+    result = await session.stream(_export_statement(draft_model, where, chunk_size))
+
+    async for rows in result.partitions():
+        yield _arrow_batch(draft_model, rows)
+
+
+async def async_iter_numpy_batches(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[NumpyBatch]:
+    """Async version of iter_numpy_batches()."""
+
+    _require(np, "numpy", "numpy")
+    result = await session.stream(_export_statement(draft_model, where, chunk_size))
+
+    async for rows in result.partitions():
+        yield _numpy_batch(draft_model, rows)
@@ -0,0 +1,84 @@
+from collections.abc import Callable, Iterable, Sequence
+from itertools import compress, repeat
+from operator import attrgetter, contains, is_, itemgetter, not_
+from typing import Final
+from weakref import WeakKeyDictionary
+
+from partial_tables.partial_table import PartialTable
+
+_CHECKER_CACHE: Final[WeakKeyDictionary[type, "CompletenessChecker"]] = WeakKeyDictionary()
+
+
+class CompletenessChecker:
+    """
+    In-process completeness checks of one partial table's loaded rows.
+
+    The getter of the PartialAllowed fields is built once, so each check reads
+    all of them in one call instead of looping over the field names.
+    """
+
+    def __init__(self, fields: tuple[str, ...]):
+        self.fields = fields
+        self._values = _values_getter(attrgetter, fields)
+
+    def is_complete(self, obj: object) -> bool:
+        """Whether every PartialAllowed field of an instance or row is set."""
+
+        return None not in self._values(obj)
+
+    def missing_fields(self, obj: object) -> tuple[str, ...]:
+        """Return the PartialAllowed fields of an instance or row that are None."""
+
+        return tuple(compress(self.fields, map(is_, self._values(obj), repeat(None))))
+
+    def complete_mask(self, rows: Iterable[object], columns: Sequence[str] | None = None) -> list[bool]:
+        """
+        Return whether each row is complete.
+
+        Rows are instances or named rows, or plain tuples laid out as columns. The
+        whole batch is checked in one pass of C-level iterators.
+        """
+
+        values = self._values
+
+        if columns is not None:
+            missing = [name for name in self.fields if name not in columns]
+
+            if missing:
+                raise ValueError(f"Columns {missing} are missing from the row layout")
+
+            values = _values_getter(itemgetter, tuple(columns.index(name) for name in self.fields))
+
+        return list(map(not_, map(contains, map(values, rows), repeat(None))))
+
+
+def _values_getter(
+    getter: Callable[..., Callable[[object], object]], keys: tuple
+) -> Callable[[object], tuple[object, ...]]:
+    """Build a getter that always returns a tuple of the values under keys."""
+
+    # attrgetter and itemgetter return a tuple for several keys but the bare value for one.
+    if len(keys) > 1:
+        return getter(*keys)
+
+    if keys:
+        single = getter(keys[0])
+
+        return lambda obj: (single(obj),)
+
+    return lambda obj: ()
+
+
+def completeness_checker(model: type[PartialTable]) -> CompletenessChecker:
+    """Return the cached completeness checker of a partial table."""
+
+    checker = _CHECKER_CACHE.get(model)
+
+    if checker is None:
+        if not issubclass(model, PartialTable):
+            raise ValueError(f"{model.__name__} is not a PartialTable")
+
+        checker = CompletenessChecker(model.__partial_fields__)
+        _CHECKER_CACHE[model] = checker
+
+    return checker
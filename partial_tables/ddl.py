@@ -0,0 +1,82 @@
+from sqlalchemy import Table, literal
+from sqlalchemy.dialects import postgresql
+
+from partial_tables.models.partitioning import PartialPartition, PartialPartitioning, PartitionMethod
+from partial_tables.models.storage import PartialStorage
+
+
+def qualified_name(table: Table, name: str) -> str:
+    """Quote name for DDL, qualified with the schema of table."""
+
+    preparer = postgresql.dialect().identifier_preparer
+
+    if table.schema is None:
+        return preparer.quote(name)
+
+    return f"{preparer.quote_schema(table.schema)}.{preparer.quote(name)}"
+
+
+def storage_statements(target: str, storage: PartialStorage) -> list[str]:
+    statements = []
+    parameters = storage.storage_parameters()
+
+    if parameters:
+        settings = ", ".join(f"{name} = {value}" for name, value in parameters.items())
+        statements.append(f"ALTER TABLE {target} SET ({settings})")
+
+    if storage.unlogged:
+        statements.append(f"ALTER TABLE {target} SET UNLOGGED")
+
+    return statements
+
+
+def partition_table_name(table: Table, partition: PartialPartition) -> str:
+    return f"{table.name}_{partition.name}"
+
+
+def _render_literal(value: object) -> str:
+    # Rendered from the value's own Python type; PostgreSQL casts it to the key's type.
+    # The named paramstyle keeps % as is; partition_statements escapes it for DDL().
+    compiled = literal(value).compile(
+        dialect=postgresql.dialect(paramstyle="named"), compile_kwargs={"literal_binds": True}
+    )
+
+    return str(compiled)
+
+
+def partition_bound(method: PartitionMethod, partition: PartialPartition) -> str:
+    if partition.default:
+        return "DEFAULT"
+
+    if method == PartitionMethod.LIST:
+        values = ", ".join("NULL" if value is None else _render_literal(value) for value in partition.values)
+
+        return f"FOR VALUES IN ({values})"
+
+    if method == PartitionMethod.RANGE:
+        start = "MINVALUE" if partition.start is None else _render_literal(partition.start)
+        end = "MAXVALUE" if partition.end is None else _render_literal(partition.end)
+
+        return f"FOR VALUES FROM ({start}) TO ({end})"
+
+    return f"FOR VALUES WITH (MODULUS {partition.modulus}, REMAINDER {partition.remainder})"
+
+
+def partition_statements(
+    table: Table,
+    partitioning: PartialPartitioning,
+    partition: PartialPartition,
+    storage: PartialStorage | None,
+) -> list[str]:
+    """Return the DDL that creates one partition of table, escaped for DDL()."""
+
+    preparer = postgresql.dialect().identifier_preparer
+    target = qualified_name(table, partition_table_name(table, partition))
+    bound = partition_bound(partitioning.method, partition)
+    statements = [f"CREATE TABLE IF NOT EXISTS {target} PARTITION OF {preparer.format_table(table)} {bound}"]
+
+    if storage is not None:
+        statements.extend(storage_statements(target, storage))
+
+    # DDL() formats its statement with %, which literals may contain.
+    return [statement.replace("%", "%%") for statement in statements]
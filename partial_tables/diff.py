@@ -0,0 +1,111 @@
+from typing import Final
+
+from sqlalchemy import BigInteger, ColumnElement, and_, case, false, literal, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from partial_tables.execution import Steps, async_run_steps, run_steps
+from partial_tables.models.diff import DiffReport, DraftDiff
+from partial_tables.pairing import model_table, paired_column_names
+from partial_tables.partial_table import PartialTable
+
+# Bits per BIGINT mask column, leaving the sign bit unused.
+MASK_BITS: Final[int] = 63
+
+
+def _changed_mask(distinct: list[ColumnElement[bool]]) -> ColumnElement[int]:
+    mask: ColumnElement[int] = literal(0, BigInteger)
+
+    for bit, is_distinct in enumerate(distinct):
+        mask = mask + case((is_distinct, literal(1 << bit, BigInteger)), else_=literal(0, BigInteger))
+
+    return mask
+
+
+def _diff_steps(
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None,
+    include_values: bool,
+) -> Steps[DiffReport]:
+    names = paired_column_names(draft_model, complete_model)
+    draft_table = model_table(draft_model)
+    complete_table = model_table(complete_model)
+    pk_names = [col.key for col in complete_table.primary_key.columns]
+    columns = tuple(name for name in names if name not in pk_names)
+    distinct = [draft_table.c[name].is_distinct_from(complete_table.c[name]) for name in columns]
+
+    # Tables with more than MASK_BITS compared columns get one mask per chunk of columns.
+    masks = [
+        _changed_mask(distinct[start : start + MASK_BITS]) for start in range(0, len(distinct), MASK_BITS)
+    ]
+    values = [case((is_distinct, draft_table.c[name])) for name, is_distinct in zip(columns, distinct)]
+    join_on = and_(*(draft_table.c[name] == complete_table.c[name] for name in pk_names))
+
+    statement = (
+        select(
+            *(draft_table.c[name] for name in pk_names),
+            complete_table.c[pk_names[0]].is_not(None),
+            *masks,
+            *(values if include_values else ()),
+        )
+        .select_from(draft_table.outerjoin(complete_table, join_on))
+        .where(true() if where is None else where, or_(false(), *distinct))
+        .order_by(*(draft_table.c[name] for name in pk_names))
+    )
+
+    masks_start = len(pk_names) + 1
+    values_start = masks_start + len(masks)
+    diffs = []
+
+    for row in (yield statement):
+        changed_mask = sum(
+            mask << (index * MASK_BITS) for index, mask in enumerate(row[masks_start:values_start])
+        )
+        changed_values = {
+            name: value
+            for bit, (name, value) in enumerate(zip(columns, row[values_start:]))
+            if changed_mask >> bit & 1
+        }
+
+        diffs.append(
+            DraftDiff(
+                key=tuple(row[: len(pk_names)]),
+                changed_mask=changed_mask,
+                published=row[len(pk_names)],
+                changed_values=changed_values,
+            )
+        )
+
+    return DiffReport(columns=columns, diffs=diffs)
+
+
+def diff_drafts(
+    session: Session,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    include_values: bool = False,
+) -> DiffReport:
+    """
+    Compare drafts with their published rows in a single query.
+
+    Drafts are joined to the complete table on the primary key and every paired
+    column is compared with IS DISTINCT FROM in the database. Only drafts with at
+    least one difference are returned, each as a bitmask of its changed columns and,
+    with include_values, the draft values of those columns.
+    """
+
+    return run_steps(session, _diff_steps(draft_model, complete_model, where, include_values))
+
+
+async def async_diff_drafts(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    include_values: bool = False,
+) -> DiffReport:
+    """Async version of diff_drafts()."""
+
+    return await async_run_steps(session, _diff_steps(draft_model, complete_model, where, include_values))
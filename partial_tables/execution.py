@@ -0,0 +1,51 @@
+from collections.abc import Generator
+from typing import Final, TypeAlias, TypeVar
+
+from sqlalchemy import Executable, Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+ResultT = TypeVar("ResultT")
+
+
+class Commit:
+    """Step that asks the runner to commit the session."""
+
+
+COMMIT: Final[Commit] = Commit()
+
+# Data operations are written once as generators that yield the statements to run
+# and receive their results, so the sync and async entry points share them.
+Steps: TypeAlias = Generator[Executable | Commit, Result | None, ResultT]
+
+
+def run_steps(session: Session, steps: Steps[ResultT]) -> ResultT:
+    """Run the steps of a data operation on a session."""
+
+    try:
+        step = next(steps)
+
+        while True:
+            if isinstance(step, Commit):
+                session.commit()
+                step = steps.send(None)
+            else:
+                step = steps.send(session.execute(step))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def async_run_steps(session: AsyncSession, steps: Steps[ResultT]) -> ResultT:
+    """Run the steps of a data operation on an async session without blocking the event loop."""
+
+    try:
+        step = next(steps)
+
+        while True:
+            if isinstance(step, Commit):
+                await session.commit()
+                step = steps.send(None)
+            else:
+                step = steps.send(await session.execute(step))
+    except StopIteration as stop:
+        return stop.value
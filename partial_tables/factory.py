@@ -0,0 +1,88 @@
+import threading
+import types
+from typing import Final
+
+from sqlalchemy.orm import declared_attr
+
+from partial_tables.partial_table import PartialSQLAlchemyMixin, PartialSQLModelMixin, PartialTable
+
+# (base, tablename, schema) -> partial table built from base.
+_PARTIAL_MODEL_CACHE: Final[dict[tuple[type, str, str | None], type[PartialTable]]] = {}
+
+# Guards the cache so that two threads never declare the same table twice.
+_PARTIAL_MODEL_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _with_schema(table_args: object, schema: str) -> tuple | dict:
+    """Return table_args with its schema keyword argument replaced by schema."""
+
+    if table_args is None:
+        return {"schema": schema}
+
+    if isinstance(table_args, dict):
+        return table_args | {"schema": schema}
+
+    if not isinstance(table_args, tuple):
+        raise ValueError(f"__table_args__ must be a tuple or a dict, not {type(table_args).__name__}")
+
+    # Positional arguments may be followed by a dictionary of keyword arguments.
+    if table_args and isinstance(table_args[-1], dict):
+        return (*table_args[:-1], table_args[-1] | {"schema": schema})
+
+    return (*table_args, {"schema": schema})
+
+
+def _table_args(base: type, schema: str | None) -> dict[str, object]:
+    """Return the namespace entries that place the partial table in schema."""
+
+    if schema is None:
+        return {}
+
+    # Looked up without invoking a declared_attr, which declarative only evaluates for mapped classes.
+    table_args = next(
+        (klass.__dict__["__table_args__"] for klass in base.__mro__ if "__table_args__" in klass.__dict__),
+        None,
+    )
+
+    if isinstance(table_args, (declared_attr, declared_attr.directive)):
+        return {
+            "__table_args__": declared_attr.directive(lambda cls: _with_schema(table_args.fget(cls), schema))
+        }
+
+    return {"__table_args__": _with_schema(table_args, schema)}
+
+
+def make_partial(base: type, tablename: str, schema: str | None = None) -> type[PartialTable]:
+    """
+    Return the partial table of base stored in tablename, building it on first use.
+
+    The class is cached per (base, tablename, schema), so asking again returns the same
+    class instead of declaring the table twice. Every partial table built from the same
+    base reuses the rewritten annotations computed for that base.
+    """
+
+    key = (base, tablename, schema)
+    model = _PARTIAL_MODEL_CACHE.get(key)
+
+    if model is not None:
+        return model
+
+    if not issubclass(base, (PartialSQLAlchemyMixin, PartialSQLModelMixin)):
+        raise ValueError(f"{base.__name__} does not use a partial table mixin")
+
+    if issubclass(base, PartialTable):
+        raise ValueError(f"{base.__name__} is already a PartialTable")
+
+    # SQLModel only maps classes declared with table=True.
+    kwds = {"table": True} if issubclass(base, PartialSQLModelMixin) else {}
+    namespace = {"__module__": base.__module__, "__tablename__": tablename} | _table_args(base, schema)
+    name = f"{base.__name__}_{schema}_{tablename}" if schema else f"{base.__name__}_{tablename}"
+
+    with _PARTIAL_MODEL_LOCK:
+        model = _PARTIAL_MODEL_CACHE.get(key)
+
+        if model is None:
+            model = types.new_class(name, (base, PartialTable), kwds, lambda ns: ns.update(namespace))
+            _PARTIAL_MODEL_CACHE[key] = model
+
+    return model
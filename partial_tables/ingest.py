@@ -0,0 +1,158 @@
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import BigInteger, ColumnElement, Insert, Table, case, cast, func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from partial_tables.execution import Steps, async_run_steps, run_steps
+from partial_tables.pairing import model_table
+from partial_tables.partial_table import FILLED_MASK_COLUMN, PartialTable
+
+
+def _merge_rows(
+    rows: Iterable[Mapping[str, object]], pk_names: list[str]
+) -> dict[tuple[object, ...], dict[str, object]]:
+    """Merge rows sharing a primary key the way the upsert would: later non-NULL values win."""
+
+    merged: dict[tuple[object, ...], dict[str, object]] = {}
+
+    for row in rows:
+        try:
+            key = tuple(row[name] for name in pk_names)
+        except KeyError as error:
+            raise ValueError(f"Ingested rows must include the primary key column {error}") from None
+
+        current = merged.setdefault(key, {})
+        current.update(
+            (name, value) for name, value in row.items() if value is not None or name not in current
+        )
+
+    return merged
+
+
+def _filled_mask_update(
+    table: Table, names: tuple[str, ...], values: dict[str, ColumnElement]
+) -> ColumnElement[int]:
+    # The bits are rendered inline, so that they don't use up the bind parameters of the rows.
+    mask: ColumnElement[int] = cast(literal_column("0"), BigInteger)
+
+    for bit, name in enumerate(names):
+        value = values.get(name, table.c[name])
+        mask = mask + case((value.is_not(None), literal_column(str(1 << bit))), else_=literal_column("0"))
+
+    return mask
+
+
+def _ingest_statement(
+    dialect: str,
+    draft_model: type[PartialTable],
+    rows: list[dict[str, object]],
+) -> Insert:
+    """Build a multi-row upsert that only fills NULL or changed PartialAllowed fields."""
+
+    table = model_table(draft_model)
+
+    if dialect == "postgresql":
+        statement = postgresql.insert(table)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(table)
+    else:
+        raise ValueError(f"Ingest is not supported on {dialect}")
+
+    partial_fields = draft_model.__partial_fields__
+    pk_names = [col.key for col in table.primary_key.columns]
+    names = [name for name in rows[0] if name not in pk_names and name != FILLED_MASK_COLUMN]
+    statement = statement.values(rows)
+
+    # A NULL from this source never overwrites a value another source already filled.
+    set_ = {
+        name: (
+            func.coalesce(statement.excluded[name], table.c[name])
+            if name in partial_fields
+            else statement.excluded[name]
+        )
+        for name in names
+    }
+
+    if FILLED_MASK_COLUMN in table.c:
+        set_[FILLED_MASK_COLUMN] = _filled_mask_update(table, partial_fields, set_)
+
+    if not set_:
+        return statement.on_conflict_do_nothing(index_elements=pk_names)
+
+    return statement.on_conflict_do_update(index_elements=pk_names, set_=set_)
+
+
+def _ingest_steps(
+    dialect: str,
+    max_parameters: int,
+    draft_model: type[PartialTable],
+    rows: Iterable[Mapping[str, object]],
+) -> Steps[int]:
+    if not issubclass(draft_model, PartialTable):
+        raise ValueError(f"{draft_model.__name__} is not a PartialTable")
+
+    table = model_table(draft_model)
+    pk_names = [col.key for col in table.primary_key.columns]
+    partial_fields = draft_model.__partial_fields__
+    groups: dict[frozenset[str], list[dict[str, object]]] = {}
+
+    for row in _merge_rows(rows, pk_names).values():
+        if FILLED_MASK_COLUMN in table.c:
+            row[FILLED_MASK_COLUMN] = sum(
+                1 << bit for bit, name in enumerate(partial_fields) if row.get(name) is not None
+            )
+
+        # A multi-row VALUES needs the same columns in every row, so rows are grouped by their columns,
+        # whatever order their keys come in.
+        groups.setdefault(frozenset(row), []).append(row)
+
+    written = 0
+
+    for names, group in groups.items():
+        # One bind parameter per value; stay under the driver's limit.
+        chunk_size = max(1, max_parameters // len(names))
+
+        for start in range(0, len(group), chunk_size):
+            result = yield _ingest_statement(dialect, draft_model, group[start : start + chunk_size])
+            written += result.rowcount
+
+    return written
+
+
+def ingest_drafts(
+    session: Session,
+    draft_model: type[PartialTable],
+    rows: Iterable[Mapping[str, object]],
+) -> int:
+    """
+    Upsert a batch of drafts, merging them with what other sources already filled in.
+
+    Each row is a dict of column keys that must include the primary key and, since
+    the database checks the proposed row before resolving the conflict, every
+    column that is NOT NULL without a default. Rows are
+    written with multi-row INSERT ... ON CONFLICT DO UPDATE statements, chunked to
+    the driver's bind parameter limit. On conflict, PartialAllowed fields are set to
+    COALESCE(new value, current value), so a NULL never erases another source's
+    value, while other provided columns are overwritten. Columns a row leaves out
+    are not touched. Returns the number of rows inserted or updated.
+    """
+
+    dialect = session.get_bind().dialect
+    steps = _ingest_steps(dialect.name, dialect.insertmanyvalues_max_parameters, draft_model, rows)
+
+    return run_steps(session, steps)
+
+
+async def async_ingest_drafts(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    rows: Iterable[Mapping[str, object]],
+) -> int:
+    """Async version of ingest_drafts()."""
+
+    dialect = session.get_bind().dialect
+    steps = _ingest_steps(dialect.name, dialect.insertmanyvalues_max_parameters, draft_model, rows)
+
+    return await async_run_steps(session, steps)
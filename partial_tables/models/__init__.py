@@ -0,0 +1,8 @@
+from .diff import DiffReport, DraftDiff
+from .promotion import PromotionMode, PromotionProgress, PromotionResult
+from .stats import CompletionReport, FieldCompletion
+from .columnar import NumpyBatch
+from .checkout import CheckoutResult
+from .cache import CacheStats
+from .storage import PartialStorage
+from .partitioning import PartialPartition, PartialPartitioning, PartitionMethod
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    """Counters of a LookupCache."""
+
+    hits: int
+    misses: int
+    # Entries dropped because the table changed, the entry expired or the cache was full.
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups served from the cache."""
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CheckoutResult(BaseModel):
+    """Row counts of a complete to draft table checkout."""
+
+    checked_out: int
+    # Published rows left alone because they already have a draft.
+    existing: int
@@ -0,0 +1,16 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NumpyBatch(BaseModel):
+    """One chunk of a partial table as NumPy arrays."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Column key -> values; NULLs of numeric columns are stored as 0.
+    columns: dict[str, Any]
+    # Column key -> True where the value is not NULL, for every nullable column.
+    valid: dict[str, Any]
+    # True where every PartialAllowed column is filled.
+    complete: Any
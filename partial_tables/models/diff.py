@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class DraftDiff(BaseModel):
+    """Columns in which one draft differs from its published row."""
+
+    key: tuple[object, ...]
+    # Bit i is set when columns[i] of the DiffReport differs.
+    changed_mask: int
+    # False when the draft has no published row yet.
+    published: bool
+    # Draft values of the changed columns, only filled when values were requested.
+    changed_values: dict[str, object] = {}
+
+
+class DiffReport(BaseModel):
+    """Differences between drafts and their published rows."""
+
+    columns: tuple[str, ...]
+    diffs: list[DraftDiff]
+
+    def changed_columns(self, diff: DraftDiff) -> list[str]:
+        """Decode the changed_mask of a diff into column names."""
+
+        return [name for index, name in enumerate(self.columns) if diff.changed_mask >> index & 1]
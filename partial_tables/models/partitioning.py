@@ -0,0 +1,73 @@
+import datetime
+from enum import StrEnum
+from typing import Annotated, Self
+
+from pydantic import BaseModel, Field, StringConstraints, model_validator
+
+# Partition names become part of table names in DDL, so only plain lowercase names are accepted.
+PartitionName = Annotated[str, StringConstraints(pattern=r"^[a-z0-9_]+$")]
+
+PartitionValue = int | float | str | datetime.datetime | datetime.date
+
+
+class PartitionMethod(StrEnum):
+    """How PostgreSQL routes rows of a partitioned table to its partitions."""
+
+    LIST = "list"
+    RANGE = "range"
+    HASH = "hash"
+
+
+class PartialPartition(BaseModel):
+    """
+    One partition of a partitioned partial table, created as <table>_<name>.
+
+    Set values for LIST, start and end for RANGE (None meaning MINVALUE and
+    MAXVALUE), modulus and remainder for HASH, or default for the partition
+    that takes every row the others don't.
+    """
+
+    name: PartitionName
+    values: list[PartitionValue | None] | None = None
+    start: PartitionValue | None = None
+    end: PartitionValue | None = None
+    modulus: int | None = Field(default=None, gt=0)
+    remainder: int | None = Field(default=None, ge=0)
+    default: bool = False
+
+
+class PartialPartitioning(BaseModel):
+    """PostgreSQL declarative partitioning of the partial side of a table pair."""
+
+    method: PartitionMethod
+    column: str
+    partitions: list[PartialPartition] = []
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> Self:
+        names = [partition.name for partition in self.partitions]
+
+        if len(set(names)) != len(names):
+            raise ValueError("Partition names must be unique")
+
+        if sum(partition.default for partition in self.partitions) > 1:
+            raise ValueError("Only one partition can be the default partition")
+
+        for partition in self.partitions:
+            if partition.default:
+                if self.method == PartitionMethod.HASH:
+                    raise ValueError("A hash partitioned table cannot have a default partition")
+
+                continue
+
+            if self.method == PartitionMethod.LIST and not partition.values:
+                raise ValueError(f"List partition {partition.name} needs values")
+
+            if self.method == PartitionMethod.HASH and (
+                partition.modulus is None
+                or partition.remainder is None
+                or partition.remainder >= partition.modulus
+            ):
+                raise ValueError(f"Hash partition {partition.name} needs a remainder lower than its modulus")
+
+        return self
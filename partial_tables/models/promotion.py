@@ -0,0 +1,27 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class PromotionMode(StrEnum):
+    """How promoted drafts are written to the complete table."""
+
+    # Plain INSERT; a draft whose primary key is already published fails the promotion.
+    INSERT = "insert"
+    # INSERT ... ON CONFLICT DO UPDATE that only rewrites published rows whose columns differ.
+    UPSERT = "upsert"
+
+
+class PromotionResult(BaseModel):
+    """Row counts of a draft to complete table promotion."""
+
+    promoted: int
+    skipped: int
+    # Complete drafts that matched their published row exactly (UPSERT mode only).
+    unchanged: int = 0
+
+
+class PromotionProgress(PromotionResult):
+    """Running totals of a batched promotion, reported after each committed batch."""
+
+    last_key: tuple[object, ...]
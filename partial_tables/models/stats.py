@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class FieldCompletion(BaseModel):
+    """How often one PartialAllowed field is filled."""
+
+    name: str
+    filled: int
+    fill_rate: float
+
+
+class CompletionReport(BaseModel):
+    """Fill rates of the PartialAllowed fields of a partial table."""
+
+    rows: int
+    complete: int
+    fields: list[FieldCompletion]
+    # Percentage of the table scanned with TABLESAMPLE; None when every row was counted.
+    sample_percent: float | None = None
+
+    @property
+    def complete_rate(self) -> float:
+        """Share of the counted rows that are complete."""
+
+        return self.complete / self.rows if self.rows else 0.0
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints
+
+# Storage parameter names are spliced into DDL, so only plain lowercase names are accepted.
+AutovacuumName = Annotated[str, StringConstraints(pattern=r"^[a-z_]+$")]
+
+
+class PartialStorage(BaseModel):
+    """PostgreSQL storage options that only apply to the partial side of a table pair."""
+
+    # Leave room on each page for HOT updates of drafts.
+    fillfactor: int | None = Field(default=None, ge=10, le=100)
+    # Autovacuum settings without their autovacuum_ prefix, e.g. {"vacuum_scale_factor": 0.01}.
+    autovacuum: dict[AutovacuumName, bool | int | float] = {}
+    tablespace: str | None = None
+    # Skip the WAL for the table; its contents are lost after a crash.
+    unlogged: bool = False
+
+    def storage_parameters(self) -> dict[str, str]:
+        """Return the storage parameters to set on the table, rendered for DDL."""
+
+        parameters = {} if self.fillfactor is None else {"fillfactor": str(self.fillfactor)}
+
+        for name, value in self.autovacuum.items():
+            parameters[f"autovacuum_{name}"] = str(value).lower() if isinstance(value, bool) else str(value)
+
+        return parameters
@@ -0,0 +1,40 @@
+from sqlalchemy import Table
+
+from partial_tables.partial_table import PartialTable
+
+
+def model_table(model: type) -> Table:
+    """Return the mapped table of a SQLAlchemy or SQLModel class."""
+
+    table = getattr(model, "__table__", None)
+
+    if table is None:
+        raise ValueError(f"{model.__name__} is not mapped to a table")
+
+    return table
+
+
+def paired_column_names(draft_model: type[PartialTable], complete_model: type) -> list[str]:
+    """
+    Return the column keys shared by a partial table and its complete sibling.
+
+    The pair must be a PartialTable and a non-partial table built from the same base,
+    so every column on the complete table is expected on the partial table.
+    """
+
+    if not issubclass(draft_model, PartialTable):
+        raise ValueError(f"{draft_model.__name__} is not a PartialTable")
+
+    if issubclass(complete_model, PartialTable):
+        raise ValueError(f"{complete_model.__name__} is a PartialTable and cannot be the complete table")
+
+    draft_table = model_table(draft_model)
+    complete_table = model_table(complete_model)
+    missing = [col.key for col in complete_table.columns if col.key not in draft_table.c]
+
+    if missing:
+        raise ValueError(
+            f"Columns {missing} of {complete_model.__name__} are missing on {draft_model.__name__}"
+        )
+
+    return [col.key for col in complete_table.columns]
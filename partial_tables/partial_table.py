@@ -1,9 +1,52 @@
 import copy
-from typing import Annotated, Optional, get_args, get_origin, get_type_hints
-
-
-class PartialAllowed:
-    """Marker for fields that can be nullable"""
+import sys
+from typing import Final
+
+from pydantic.fields import FieldInfo
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Column,
+    ColumnElement,
+    Computed,
+    FetchedValue,
+    Index,
+    Table,
+    UniqueConstraint,
+    and_,
+    event,
+    inspect,
+    true,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.attributes import set_attribute
+
+from partial_tables.annotations import rewrite_type_hints
+from partial_tables.ddl import partition_statements, qualified_name, storage_statements
+from partial_tables.models.partitioning import PartialPartitioning
+from partial_tables.models.storage import PartialStorage
+
+if sys.version_info >= (3, 14):
+    from annotationlib import Format, get_annotations
+
+IS_COMPLETE_COLUMN: Final[str] = "is_complete"
+FILLED_MASK_COLUMN: Final[str] = "filled_mask"
+
+# The mask is stored in a signed BIGINT, so the sign bit is left unused.
+MAX_MASK_FIELDS: Final[int] = 63
+
+# Mutable FieldInfo containers that pydantic updates in place while building a subclass.
+_FIELD_INFO_CONTAINERS: Final[tuple[str, ...]] = ("metadata", "_attributes_set", "_qualifiers")
+
+# table.info key marking tables whose storage options were already applied.
+_STORAGE_APPLIED: Final[str] = "partial_storage_applied"
+
+# table.info key marking tables whose partitions were already declared.
+_PARTITIONING_APPLIED: Final[str] = "partial_partitioning_applied"
 
 
 class PartialTable:
@@ -11,39 +54,352 @@ class PartialTable:
     Marker for tables that are Partial.
 
     Any field that has the PartialAllowed() annotation will be nullable.
+    The names of those fields are recorded on the class as __partial_fields__.
+
+    Set __partial_complete_column__ = True to also add an indexed, generated
+    is_complete column that the database keeps in sync with those fields.
+
+    Set __partial_mask_column__ = True to also add an indexed filled_mask column,
+    with bit i set when __partial_fields__[i] is not NULL. The ORM keeps it
+    current on flush. Also set __partial_mask_trigger__ = True to have a
+    PostgreSQL trigger maintain it instead, so writes that bypass the ORM
+    keep it current too.
+
+    Set __partial_sparse_indexes__ = True to turn the unique/index options of
+    PartialAllowed columns into partial indexes WHERE col IS NOT NULL, so the
+    mostly NULL draft values stay out of them. The complete sibling keeps its
+    normal indexes.
+
+    Set __partial_storage__ to a PartialStorage, e.g. on the shared base, to give
+    the partial table its own PostgreSQL storage options.
+
+    Set __partial_partitioning__ to a PartialPartitioning to make the partial
+    table a PostgreSQL partitioned table and create its partitions with it.
+    Nullability, indexes and the mask trigger are declared on the parent, which
+    PostgreSQL propagates to every partition; storage options are set on each
+    partition. The partition key must be part of the primary key and of every
+    unique index or constraint.
+    """
+
+    __partial_fields__: tuple[str, ...] = ()
+    __partial_complete_column__: bool = False
+    __partial_mask_column__: bool = False
+    __partial_mask_trigger__: bool = False
+    __partial_sparse_indexes__: bool = False
+    __partial_storage__: PartialStorage | None = None
+    __partial_partitioning__: PartialPartitioning | None = None
+
+    @hybrid_property
+    def is_complete(self) -> bool:
+        """Whether every PartialAllowed field is set."""
+
+        return all(getattr(self, name) is not None for name in self.__partial_fields__)
+
+    @is_complete.inplace.expression
+    @classmethod
+    def _is_complete_expression(cls) -> ColumnElement[bool]:
+        table = cls.__table__
+
+        if cls.__partial_complete_column__:
+            return table.c[IS_COMPLETE_COLUMN]
+
+        return _completeness_clause(table, cls.__partial_fields__)
+
+    @classmethod
+    def missing_exactly(cls, *names: str) -> ColumnElement[bool]:
+        """Filter for rows where exactly the given PartialAllowed fields are NULL."""
+
+        missing = _field_mask(cls, names)
+        table = cls.__table__
+
+        if cls.__partial_mask_column__:
+            return table.c[FILLED_MASK_COLUMN] == _full_mask(cls) & ~missing
+
+        return and_(
+            true(),
+            *(
+                table.c[name].is_(None) if missing & 1 << bit else table.c[name].is_not(None)
+                for bit, name in enumerate(cls.__partial_fields__)
+            ),
+        )
+
+    @classmethod
+    def missing_at_most(cls, *names: str) -> ColumnElement[bool]:
+        """Filter for rows where no PartialAllowed field other than the given ones is NULL."""
+
+        required = _full_mask(cls) & ~_field_mask(cls, names)
+        table = cls.__table__
+
+        if cls.__partial_mask_column__:
+            return table.c[FILLED_MASK_COLUMN].bitwise_and(required) == required
+
+        return and_(
+            true(),
+            *(
+                table.c[name].is_not(None)
+                for bit, name in enumerate(cls.__partial_fields__)
+                if required & 1 << bit
+            ),
+        )
+
+
+def _own_annotations(cls: type) -> dict[str, object]:
+    if sys.version_info >= (3, 14):
+        # Keeps names that are not defined yet as forward references.
+        return get_annotations(cls, format=Format.FORWARDREF)
+
+    return dict(getattr(cls, "__annotations__", {}))
+
+
+def _clone_field_info(field_info: FieldInfo) -> FieldInfo:
     """
+    Copy a FieldInfo deep enough for a partial table to own it.
+
+    Pydantic only mutates the FieldInfo's own attributes and containers, and SQLModel
+    attaches an explicit sa_column to the table it builds, so only those are copied.
+    """
+
+    clone = copy.copy(field_info)
+
+    for attr in _FIELD_INFO_CONTAINERS:
+        value = getattr(clone, attr, None)
+
+        if value is not None:
+            setattr(clone, attr, value.copy())
+
+    sa_column = getattr(clone, "sa_column", None)
+
+    if isinstance(sa_column, Column):
+        # pylint: disable-next=protected-access
+        clone.sa_column = sa_column._copy()
+
+    return clone
+
+
+def _completeness_clause(table: Table, names: tuple[str, ...]) -> ColumnElement[bool]:
+    return and_(true(), *(table.c[name].is_not(None) for name in names))
+
+
+def _add_complete_column(table: Table, names: tuple[str, ...]) -> None:
+    # Subclasses sharing their parent's table already have the column.
+    if IS_COMPLETE_COLUMN in table.c:
+        return
+
+    # The column is added after mapping so the ORM never tries to write it.
+    table.append_column(
+        Column(
+            IS_COMPLETE_COLUMN,
+            Boolean,
+            Computed(_completeness_clause(table, names), persisted=True),
+            nullable=False,
+            index=True,
+        )
+    )
+
+
+def _full_mask(cls: type[PartialTable]) -> int:
+    return (1 << len(cls.__partial_fields__)) - 1
+
+
+def _field_mask(cls: type[PartialTable], names: tuple[str, ...]) -> int:
+    bits = {name: 1 << bit for bit, name in enumerate(cls.__partial_fields__)}
+    mask = 0
+
+    for name in names:
+        if name not in bits:
+            raise ValueError(f"{name} is not a PartialAllowed field of {cls.__name__}")
+
+        mask |= bits[name]
+
+    return mask
+
+
+def _filled_mask(target: PartialTable) -> int:
+    return sum(
+        1 << bit for bit, name in enumerate(target.__partial_fields__) if getattr(target, name) is not None
+    )
 
 
-def _rewrite_with_optional(a: object) -> object:
-    origin = get_origin(a)
+def _update_filled_mask(_mapper: Mapper, connection: Connection, target: PartialTable) -> None:
+    if target.__partial_mask_trigger__ and connection.dialect.name == "postgresql":
+        # The trigger computes the mask and the ORM fetches it back.
+        return
 
-    if origin is Annotated:
-        base, *meta = get_args(a)
+    mask = _filled_mask(target)
 
-        if any(isinstance(m, PartialAllowed) for m in meta):
-            return Annotated[Optional[base], *meta]
+    if getattr(target, FILLED_MASK_COLUMN, None) != mask:
+        # set_attribute goes through the ORM, which also works for pydantic models
+        # that reject attributes they don't declare as fields.
+        set_attribute(target, FILLED_MASK_COLUMN, mask)
 
-        new_base = _rewrite_with_optional(base)
 
-        if new_base is not base:
-            return Annotated[new_base, *meta]
+def _add_mask_trigger(table: Table, names: tuple[str, ...]) -> None:
+    """Install a trigger function that recomputes the mask on every INSERT and UPDATE."""
 
-        return a
+    preparer = postgresql.dialect().identifier_preparer
+    name = f"{table.name}_{FILLED_MASK_COLUMN}"
+    function = qualified_name(table, name)
+    mask = " | ".join(
+        f"(CASE WHEN NEW.{preparer.quote(field)} IS NOT NULL THEN {1 << bit} ELSE 0 END)"
+        for bit, field in enumerate(names)
+    )
 
-    args = get_args(a)
+    create_function = DDL(f"""CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+BEGIN
+    NEW.{preparer.quote(FILLED_MASK_COLUMN)} := {mask or "0"};
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql""")
+    create_trigger = DDL(
+        f"CREATE TRIGGER {preparer.quote(name)} BEFORE INSERT OR UPDATE ON {preparer.format_table(table)} "
+        f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+    )
+    # Dropping the table drops the trigger but leaves the function behind.
+    drop_function = DDL(f"DROP FUNCTION IF EXISTS {function}()")
 
-    if not args:
-        return a
+    event.listen(table, "after_create", create_function.execute_if(dialect="postgresql"))
+    event.listen(table, "after_create", create_trigger.execute_if(dialect="postgresql"))
+    event.listen(table, "after_drop", drop_function.execute_if(dialect="postgresql"))
 
-    new_args = tuple(_rewrite_with_optional(x) for x in args)
 
-    if new_args != args and origin is not None and hasattr(origin, "__class_getitem__"):
-        # Avoid passing a single-element tuple which would produce origin[(T,)].
-        param = new_args[0] if len(new_args) == 1 else new_args
+def _add_mask_column(mapper: Mapper, names: tuple[str, ...], trigger: bool) -> None:
+    if len(names) > MAX_MASK_FIELDS:
+        raise ValueError(f"{FILLED_MASK_COLUMN} supports at most {MAX_MASK_FIELDS} PartialAllowed fields")
 
-        return origin[param]  # type: ignore[index]
+    table = mapper.local_table
 
-    return a
+    # Subclasses sharing their parent's table inherit both the column and its listeners.
+    if FILLED_MASK_COLUMN in table.c:
+        return
+
+    # FetchedValue tells the ORM to read back what the trigger wrote.
+    server_values = {"server_default": FetchedValue(), "server_onupdate": FetchedValue()} if trigger else {}
+    table.append_column(Column(FILLED_MASK_COLUMN, BigInteger, nullable=False, index=True, **server_values))
+    mapper.add_property(FILLED_MASK_COLUMN, table.c[FILLED_MASK_COLUMN])
+
+    if trigger:
+        _add_mask_trigger(table, names)
+
+    event.listen(mapper, "before_insert", _update_filled_mask, propagate=True)
+    event.listen(mapper, "before_update", _update_filled_mask, propagate=True)
+
+
+def _add_sparse_indexes(table: Table, names: tuple[str, ...]) -> None:
+    """Replace the indexes and unique constraints that unique=/index= created on partial columns."""
+
+    for name in names:
+        col = table.c[name]
+        flagged = [
+            item
+            for item in (*table.indexes, *table.constraints)
+            if isinstance(item, (Index, UniqueConstraint))
+            and getattr(item, "_column_flag", False)
+            and list(item.columns) == [col]
+        ]
+
+        if not flagged:
+            continue
+
+        for item in flagged:
+            if isinstance(item, Index):
+                table.indexes.discard(item)
+            else:
+                table.constraints.discard(item)
+
+        # NULLs never collide in a unique index, so leaving them out keeps the same guarantee.
+        Index(
+            None,
+            col,
+            unique=bool(col.unique),
+            postgresql_where=col.is_not(None),
+            sqlite_where=col.is_not(None),
+        )
+
+        # Stop copies of the table, e.g. Table.to_metadata(), from recreating the full indexes.
+        col.unique = col.index = False
+
+
+def _apply_storage(table: Table, storage: PartialStorage, partitioned: bool) -> None:
+    # Subclasses sharing their parent's table already have its options.
+    if table.info.get(_STORAGE_APPLIED):
+        return
+
+    table.info[_STORAGE_APPLIED] = True
+
+    if storage.tablespace is not None:
+        # On a partitioned table this is the default tablespace of its partitions.
+        table.dialect_kwargs["postgresql_tablespace"] = storage.tablespace
+
+    # A partitioned table stores no rows itself; its partitions get the options instead.
+    if partitioned:
+        return
+
+    # CREATE TABLE has no storage parameters in SQLAlchemy, so they are set right after it.
+    for statement in storage_statements(
+        postgresql.dialect().identifier_preparer.format_table(table), storage
+    ):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def _apply_partitioning(
+    table: Table,
+    partitioning: PartialPartitioning,
+    storage: PartialStorage | None,
+) -> None:
+    # Subclasses sharing their parent's table already have its partitions.
+    if table.info.get(_PARTITIONING_APPLIED):
+        return
+
+    table.info[_PARTITIONING_APPLIED] = True
+
+    if partitioning.column not in table.c:
+        raise ValueError(f"Column {partitioning.column} is not available")
+
+    key = table.c[partitioning.column]
+
+    if table.primary_key.columns and not table.primary_key.columns.contains_column(key):
+        raise ValueError(f"The primary key of a partitioned table must include {partitioning.column}")
+
+    # PostgreSQL only enforces uniqueness within each partition, so it rejects keys that leave it out.
+    for item in (*table.indexes, *table.constraints):
+        unique = isinstance(item, UniqueConstraint) or (isinstance(item, Index) and item.unique)
+
+        if unique and not item.columns.contains_column(key):
+            names = ", ".join(col.name for col in item.columns) or item.name
+            raise ValueError(
+                f"The unique index or constraint on ({names}) of a partitioned table must include "
+                f"{partitioning.column}"
+            )
+
+    preparer = postgresql.dialect().identifier_preparer
+    table.dialect_kwargs["postgresql_partition_by"] = (
+        f"{partitioning.method.upper()} ({preparer.quote(key.name)})"
+    )
+
+    for partition in partitioning.partitions:
+        for statement in partition_statements(table, partitioning, partition, storage):
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def _apply_table_options(mapper: Mapper, cls: type[PartialTable]) -> None:
+    """Add the opt-in columns, indexes, storage options and partitions of a mapped partial table."""
+
+    table = mapper.local_table
+
+    if cls.__partial_complete_column__:
+        _add_complete_column(table, cls.__partial_fields__)
+
+    if cls.__partial_mask_column__:
+        _add_mask_column(mapper, cls.__partial_fields__, cls.__partial_mask_trigger__)
+
+    if cls.__partial_sparse_indexes__:
+        _add_sparse_indexes(table, cls.__partial_fields__)
+
+    if cls.__partial_storage__ is not None:
+        _apply_storage(table, cls.__partial_storage__, cls.__partial_partitioning__ is not None)
+
+    if cls.__partial_partitioning__ is not None:
+        _apply_partitioning(table, cls.__partial_partitioning__, cls.__partial_storage__)
 
 
 class PartialSQLAlchemyMixin:
@@ -58,20 +414,18 @@ class PartialSQLAlchemyMixin:
             super().__init_subclass__(**kwargs)
             return
 
-        type_hints = get_type_hints(cls, include_extras=True)
-        raw_annotations = dict(getattr(cls, "__annotations__", {}))
-        updated_nullable_names: list[str] = []
-
-        for name, ann in type_hints.items():
-            new_ann = _rewrite_with_optional(ann)
-
-            if new_ann is not ann:
-                raw_annotations[name] = new_ann
-                updated_nullable_names.append(name)
+        rewritten = rewrite_type_hints(cls)
+        raw_annotations = _own_annotations(cls) | rewritten if rewritten else {}
+        updated_nullable_names = list(rewritten)
 
         if raw_annotations:
             cls.__annotations__ = raw_annotations
 
+        cls.__partial_fields__ = tuple(updated_nullable_names)
+
+        if cls.__partial_mask_trigger__ and not cls.__partial_mask_column__:
+            raise ValueError("__partial_mask_trigger__ requires __partial_mask_column__")
+
         # Run Declarative mapping so that __table__ / columns are available
         super().__init_subclass__(**kwargs)
 
@@ -94,6 +448,9 @@ class PartialSQLAlchemyMixin:
 
                 col.nullable = True  # type: ignore[attr-defined]
 
+        if getattr(cls, "__table__", None) is not None:
+            _apply_table_options(inspect(cls), cls)
+
 
 class PartialSQLModelMixin:
     """
@@ -107,25 +464,29 @@ class PartialSQLModelMixin:
             super().__init_subclass__(**kwargs)
             return
 
-        type_hints = get_type_hints(cls, include_extras=True)
-        raw_annotations = dict(getattr(cls, "__annotations__", {}))
+        rewritten = rewrite_type_hints(cls)
+        raw_annotations = _own_annotations(cls) | rewritten if rewritten else {}
         inherited_fields = getattr(cls, "model_fields", {})
+        updated_nullable_names = list(rewritten)
 
-        for name, ann in type_hints.items():
-            new_ann = _rewrite_with_optional(ann)
-
-            if new_ann is not ann:
-                raw_annotations[name] = new_ann
-
-                # A field the partial table declares itself is already its own
-                # and is kept as-is. An inherited field is shared with the
-                # non-partial sibling table, so give the partial table its own
-                # copy to stop SQLModel from mutating a Column shared between
-                # the two tables (which would strip options like unique/index).
-                if name not in cls.__dict__:
-                    setattr(cls, name, copy.deepcopy(inherited_fields[name]))
+        for name in updated_nullable_names:
+            # A field the partial table declares itself is already its own
+            # and is kept as-is. An inherited field is shared with the
+            # non-partial sibling table, so give the partial table its own
+            # copy to stop SQLModel from mutating a Column shared between
+            # the two tables (which would strip options like unique/index).
+            if name not in cls.__dict__:
+                setattr(cls, name, _clone_field_info(inherited_fields[name]))
 
         if raw_annotations:
             cls.__annotations__ = raw_annotations
 
+        cls.__partial_fields__ = tuple(updated_nullable_names)
+
+        if cls.__partial_mask_trigger__ and not cls.__partial_mask_column__:
+            raise ValueError("__partial_mask_trigger__ requires __partial_mask_column__")
+
+        # SQLModel only builds the table once the metaclass has finished with the class.
+        event.listen(cls, "after_mapper_constructed", _apply_table_options)
+
         super().__init_subclass__(**kwargs)
@@ -0,0 +1,194 @@
+from typing import Final
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    ColumnElement,
+    Table,
+    and_,
+    cast,
+    false,
+    func,
+    literal,
+    or_,
+    text,
+    true,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+from partial_tables.ddl import partition_statements, partition_table_name
+from partial_tables.execution import Steps, async_run_steps, run_steps
+from partial_tables.models.partitioning import PartialPartition, PartialPartitioning, PartitionMethod
+from partial_tables.pairing import model_table
+from partial_tables.partial_table import PartialTable
+
+_PARTITIONS_QUERY: Final[TextClause] = text(
+    "SELECT child.relname FROM pg_inherits JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+)
+
+
+def _partitioning(draft_model: type[PartialTable]) -> PartialPartitioning:
+    if not issubclass(draft_model, PartialTable):
+        raise ValueError(f"{draft_model.__name__} is not a PartialTable")
+
+    if draft_model.__partial_partitioning__ is None:
+        raise ValueError(f"{draft_model.__name__} is not partitioned")
+
+    return draft_model.__partial_partitioning__
+
+
+def _range_clause(column: Column, start: object | None, end: object | None) -> ColumnElement[bool]:
+    # NULL keys never fall in a range.
+    clauses = [column.is_not(None)]
+
+    if start is not None:
+        clauses.append(column >= start)
+
+    if end is not None:
+        clauses.append(column < end)
+
+    return and_(true(), *clauses)
+
+
+def _bound_clause(
+    table: Table, partitioning: PartialPartitioning, partition: PartialPartition
+) -> ColumnElement[bool]:
+    column = table.c[partitioning.column]
+
+    if partitioning.method == PartitionMethod.LIST:
+        values = [value for value in partition.values if value is not None]
+        clauses = [column.in_(values)] if values else []
+
+        if None in partition.values:
+            clauses.append(column.is_(None))
+
+        return or_(false(), *clauses)
+
+    if partitioning.method == PartitionMethod.RANGE:
+        return _range_clause(column, partition.start, partition.end)
+
+    preparer = postgresql.dialect().identifier_preparer
+
+    # The same check PostgreSQL runs for the partition constraint of a hash partition.
+    return func.satisfies_hash_partition(
+        cast(literal(preparer.format_table(table)), postgresql.REGCLASS),
+        partition.modulus,
+        partition.remainder,
+        column,
+        type_=Boolean,
+    )
+
+
+def _default_clause(table: Table, partitioning: PartialPartitioning) -> ColumnElement[bool]:
+    """Match the keys no other partition takes, with comparisons PostgreSQL can prune with."""
+
+    column = table.c[partitioning.column]
+    others = [partition for partition in partitioning.partitions if not partition.default]
+
+    if partitioning.method == PartitionMethod.LIST:
+        values = [value for partition in others for value in partition.values if value is not None]
+        # NOT IN never matches a NULL key, which is only added when no partition takes it.
+        clauses = [column.not_in(values) if values else column.is_not(None)]
+
+        if not any(None in partition.values for partition in others):
+            clauses.append(column.is_(None))
+
+        return or_(*clauses)
+
+    # Range partitions never overlap, so the gaps between them are what the default partition takes.
+    clauses = [column.is_(None)]
+    bounds = sorted(
+        ((partition.start, partition.end) for partition in others),
+        key=lambda bound: (bound[0] is not None, bound[0]),
+    )
+    covered = None
+
+    for start, end in bounds:
+        if start != covered:
+            clauses.append(_range_clause(column, covered, start))
+
+        covered = end
+
+        if covered is None:
+            break
+    else:
+        clauses.append(_range_clause(column, covered, None))
+
+    return or_(*clauses)
+
+
+def partition_clause(draft_model: type[PartialTable], name: str) -> ColumnElement[bool]:
+    """
+    Return a filter matching the rows that belong to one partition of a partitioned partial table.
+
+    Pass it as the where of promote(), promote_claimed(), completion_stats() and the
+    other data APIs to scope them to that partition, so separate workers can each
+    take a partition. LIST and RANGE filters compare the partition key with the
+    partition bounds, so PostgreSQL prunes the other partitions. A HASH filter only
+    scopes the rows: PostgreSQL can't prune with it and scans every partition.
+    """
+
+    partitioning = _partitioning(draft_model)
+    table = model_table(draft_model)
+    partitions = {partition.name: partition for partition in partitioning.partitions}
+
+    if name not in partitions:
+        raise ValueError(f"{name} is not a partition of {draft_model.__name__}")
+
+    if partitions[name].default:
+        return _default_clause(table, partitioning)
+
+    return _bound_clause(table, partitioning, partitions[name])
+
+
+def _create_partitions_steps(dialect: str, draft_model: type[PartialTable]) -> Steps[list[str]]:
+    partitioning = _partitioning(draft_model)
+
+    if dialect != "postgresql":
+        raise ValueError(f"Partitioning is not supported on {dialect}")
+
+    table = model_table(draft_model)
+    parent = postgresql.dialect().identifier_preparer.format_table(table)
+    existing = set((yield _PARTITIONS_QUERY.bindparams(parent=parent)).scalars())
+    created = []
+
+    for partition in partitioning.partitions:
+        name = partition_table_name(table, partition)
+
+        if name in existing:
+            continue
+
+        for statement in partition_statements(
+            table, partitioning, partition, draft_model.__partial_storage__
+        ):
+            yield DDL(statement)
+
+        created.append(name)
+
+    return created
+
+
+def create_partitions(session: Session, draft_model: type[PartialTable]) -> list[str]:
+    """
+    Create the declared partitions of a partitioned partial table that don't exist yet.
+
+    Partitions are created with the table by create_all(); this adds the ones
+    declared since, e.g. the next month of a table partitioned by range, with
+    the partial table's storage options. Returns the names of the created
+    partitions. Committing is up to the caller.
+    """
+
+    return run_steps(session, _create_partitions_steps(session.get_bind().dialect.name, draft_model))
+
+
+async def async_create_partitions(session: AsyncSession, draft_model: type[PartialTable]) -> list[str]:
+    """Async version of create_partitions()."""
+
+    return await async_run_steps(
+        session, _create_partitions_steps(session.get_bind().dialect.name, draft_model)
+    )
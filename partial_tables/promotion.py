@@ -0,0 +1,329 @@
+from collections.abc import Callable, Mapping, Sequence
+
+from sqlalchemy import ColumnElement, and_, delete, func, not_, select, true, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from partial_tables.execution import COMMIT, Steps, async_run_steps, run_steps
+from partial_tables.models.promotion import PromotionMode, PromotionProgress, PromotionResult
+from partial_tables.pairing import model_table, paired_column_names
+from partial_tables.partial_table import PartialTable
+from partial_tables.statements import keys_clause, promotion_rows, promotion_statement
+
+
+def _write_promotion_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    scope: ColumnElement[bool],
+    mode: PromotionMode,
+) -> Steps[PromotionResult]:
+    """Promote the complete drafts in scope, without counting the incomplete ones."""
+
+    _, rows = promotion_rows(draft_model, complete_model, scope)
+    statement = promotion_statement(dialect, draft_model, complete_model, scope, mode)
+    promotion_result = yield statement
+    # Rows are only returned to a LookupCache, otherwise none are fetched.
+    promoted = len(promotion_result.all()) if statement.exported_columns else promotion_result.rowcount
+    unchanged = 0
+
+    if mode is PromotionMode.UPSERT:
+        candidates_result = yield select(func.count()).select_from(rows.subquery())
+        unchanged = candidates_result.scalar_one() - promoted
+
+    return PromotionResult(promoted=promoted, skipped=0, unchanged=unchanged)
+
+
+def _promotion_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None,
+    mode: PromotionMode,
+) -> Steps[PromotionResult]:
+    # Rejects a mismatched pair before any statement runs.
+    paired_column_names(draft_model, complete_model)
+
+    draft_table = model_table(draft_model)
+    scope = true() if where is None else where
+
+    skipped_result = (
+        yield select(func.count()).select_from(draft_table).where(scope, not_(draft_model.is_complete))
+    )
+    skipped = skipped_result.scalar_one()
+
+    result = yield from _write_promotion_steps(dialect, draft_model, complete_model, scope, mode)
+
+    return PromotionResult(promoted=result.promoted, skipped=skipped, unchanged=result.unchanged)
+
+
+def _batch_promotion_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None,
+    batch_size: int,
+    after: Sequence[object] | None,
+    on_batch: Callable[[PromotionProgress], None] | None,
+    mode: PromotionMode,
+) -> Steps[PromotionResult]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    pk_columns = list(model_table(draft_model).primary_key.columns)
+    key = tuple_(*pk_columns)
+    scope = true() if where is None else where
+    last_key = None if after is None else tuple(after)
+    progress = PromotionProgress(promoted=0, skipped=0, unchanged=0, last_key=last_key or ())
+
+    while True:
+        batch_scope = scope if last_key is None else and_(scope, key > tuple_(*last_key))
+        batch = select(*pk_columns).where(batch_scope).order_by(*pk_columns).limit(batch_size).subquery()
+        upper = (yield select(*batch.c).order_by(*(c.desc() for c in batch.c)).limit(1)).first()
+
+        if upper is None:
+            break
+
+        result = yield from _promotion_steps(
+            dialect,
+            draft_model,
+            complete_model,
+            and_(batch_scope, key <= tuple_(*upper)),
+            mode,
+        )
+        yield COMMIT
+
+        last_key = tuple(upper)
+        progress = PromotionProgress(
+            promoted=progress.promoted + result.promoted,
+            skipped=progress.skipped + result.skipped,
+            unchanged=progress.unchanged + result.unchanged,
+            last_key=last_key,
+        )
+
+        if on_batch is not None:
+            on_batch(progress)
+
+    return PromotionResult(promoted=progress.promoted, skipped=progress.skipped, unchanged=progress.unchanged)
+
+
+def _claimed_promotion_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None,
+    batch_size: int,
+    mode: PromotionMode,
+    mark: Mapping[str, object] | None,
+    max_batches: int | None,
+) -> Steps[PromotionResult]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    draft_table = model_table(draft_model)
+    pk_columns = list(draft_table.primary_key.columns)
+    scope = true() if where is None else where
+
+    if mark is not None:
+        # Marked drafts stay in the table, so they must not be claimed and promoted again.
+        scope = and_(
+            scope,
+            not_(
+                and_(
+                    true(), *(draft_table.c[name].is_not_distinct_from(value) for name, value in mark.items())
+                )
+            ),
+        )
+
+    # SKIP LOCKED lets each worker claim drafts no other worker holds instead of waiting for them.
+    claim = (
+        select(*pk_columns)
+        .where(scope, draft_model.is_complete)
+        .order_by(*pk_columns)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    totals = PromotionResult(promoted=0, skipped=0, unchanged=0)
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        keys = (yield claim).all()
+
+        if not keys:
+            break
+
+        claimed = keys_clause(pk_columns, keys)
+
+        # Only complete drafts are claimed, so there are no skipped drafts to count.
+        result = yield from _write_promotion_steps(dialect, draft_model, complete_model, claimed, mode)
+
+        if mark is None:
+            yield delete(draft_table).where(claimed)
+        else:
+            yield update(draft_table).where(claimed).values(mark)
+
+        # Committing releases the claimed rows together with their promotion.
+        yield COMMIT
+
+        batches += 1
+        totals = PromotionResult(
+            promoted=totals.promoted + result.promoted,
+            skipped=0,
+            unchanged=totals.unchanged + result.unchanged,
+        )
+
+    return totals
+
+
+def promote(
+    session: Session,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    mode: PromotionMode = PromotionMode.INSERT,
+) -> PromotionResult:
+    """
+    Copy complete drafts into the complete table with a single INSERT ... SELECT.
+
+    Drafts matching `where` that still have a NULL PartialAllowed column are skipped.
+    In UPSERT mode, drafts that are already published only rewrite the columns of
+    their published row when at least one differs, and are left alone otherwise.
+    The transaction is left open; committing is up to the caller.
+    """
+
+    steps = _promotion_steps(session.get_bind().dialect.name, draft_model, complete_model, where, mode)
+
+    return run_steps(session, steps)
+
+
+async def async_promote(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    mode: PromotionMode = PromotionMode.INSERT,
+) -> PromotionResult:
+    """Async version of promote()."""
+
+    steps = _promotion_steps(session.get_bind().dialect.name, draft_model, complete_model, where, mode)
+
+    return await async_run_steps(session, steps)
+
+
+def promote_in_batches(
+    session: Session,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int = 1000,
+    after: Sequence[object] | None = None,
+    on_batch: Callable[[PromotionProgress], None] | None = None,
+    mode: PromotionMode = PromotionMode.INSERT,
+) -> PromotionResult:
+    """
+    Promote drafts batch by batch in primary key order, committing after each batch.
+
+    Batches are found with keyset pagination, so each one is a range scan on the
+    primary key. Pass the last_key of a reported PromotionProgress as `after` to
+    resume an interrupted run.
+    """
+
+    steps = _batch_promotion_steps(
+        session.get_bind().dialect.name,
+        draft_model,
+        complete_model,
+        where,
+        batch_size,
+        after,
+        on_batch,
+        mode,
+    )
+
+    return run_steps(session, steps)
+
+
+async def async_promote_in_batches(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int = 1000,
+    after: Sequence[object] | None = None,
+    on_batch: Callable[[PromotionProgress], None] | None = None,
+    mode: PromotionMode = PromotionMode.INSERT,
+) -> PromotionResult:
+    """Async version of promote_in_batches()."""
+
+    steps = _batch_promotion_steps(
+        session.get_bind().dialect.name,
+        draft_model,
+        complete_model,
+        where,
+        batch_size,
+        after,
+        on_batch,
+        mode,
+    )
+
+    return await async_run_steps(session, steps)
+
+
+def promote_claimed(
+    session: Session,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int = 1000,
+    mode: PromotionMode = PromotionMode.INSERT,
+    mark: Mapping[str, object] | None = None,
+    max_batches: int | None = None,
+) -> PromotionResult:
+    """
+    Promote complete drafts from one of many concurrent workers.
+
+    Each batch claims up to batch_size complete drafts with SELECT ... FOR UPDATE
+    SKIP LOCKED, so workers never wait on or promote the same drafts. The claimed
+    drafts are promoted and then deleted, or updated with the `mark` values, and the
+    batch is committed. Drafts that already hold every `mark` value are not claimed.
+    Batches continue until no draft can be claimed or max_batches is reached.
+    Incomplete drafts are never claimed and are not counted as skipped.
+    """
+
+    steps = _claimed_promotion_steps(
+        session.get_bind().dialect.name,
+        draft_model,
+        complete_model,
+        where,
+        batch_size,
+        mode,
+        mark,
+        max_batches,
+    )
+
+    return run_steps(session, steps)
+
+
+async def async_promote_claimed(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    where: ColumnElement[bool] | None = None,
+    batch_size: int = 1000,
+    mode: PromotionMode = PromotionMode.INSERT,
+    mark: Mapping[str, object] | None = None,
+    max_batches: int | None = None,
+) -> PromotionResult:
+    """Async version of promote_claimed()."""
+
+    steps = _claimed_promotion_steps(
+        session.get_bind().dialect.name,
+        draft_model,
+        complete_model,
+        where,
+        batch_size,
+        mode,
+        mark,
+        max_batches,
+    )
+
+    return await async_run_steps(session, steps)
@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+
+from sqlalchemy import Column, ColumnElement, Insert, Select, Table, insert, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from partial_tables.cache import caches_of
+from partial_tables.models.promotion import PromotionMode
+from partial_tables.pairing import model_table, paired_column_names
+from partial_tables.partial_table import PartialTable
+
+
+def _upsert_statement(
+    dialect: str,
+    complete_table: Table,
+    names: list[str],
+    rows: Select,
+) -> Insert:
+    """Build an INSERT ... SELECT that only rewrites published rows whose columns differ."""
+
+    if dialect == "postgresql":
+        statement = postgresql.insert(complete_table)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(complete_table)
+    else:
+        raise ValueError(f"Upsert promotion is not supported on {dialect}")
+
+    statement = statement.from_select([complete_table.c[name] for name in names], rows)
+    pk_names = [col.key for col in complete_table.primary_key.columns]
+    update_names = [name for name in names if name not in pk_names]
+
+    if not update_names:
+        return statement.on_conflict_do_nothing(index_elements=pk_names)
+
+    return statement.on_conflict_do_update(
+        index_elements=pk_names,
+        set_={name: statement.excluded[name] for name in update_names},
+        where=or_(
+            *(complete_table.c[name].is_distinct_from(statement.excluded[name]) for name in update_names)
+        ),
+    )
+
+
+def keys_clause(pk_columns: list[Column], keys: Sequence[Sequence[object]]) -> ColumnElement[bool]:
+    """Match the rows whose primary key is one of keys."""
+
+    if len(pk_columns) == 1:
+        return pk_columns[0].in_([key[0] for key in keys])
+
+    return tuple_(*pk_columns).in_([tuple(key) for key in keys])
+
+
+def promotion_rows(
+    draft_model: type[PartialTable], complete_model: type, scope: ColumnElement[bool]
+) -> tuple[list[str], Select]:
+    """Return the paired column names and the SELECT of the complete drafts in scope."""
+
+    names = paired_column_names(draft_model, complete_model)
+    draft_table = model_table(draft_model)
+
+    return names, select(*(draft_table.c[name] for name in names)).where(scope, draft_model.is_complete)
+
+
+def promotion_statement(
+    dialect: str,
+    draft_model: type[PartialTable],
+    complete_model: type,
+    scope: ColumnElement[bool],
+    mode: PromotionMode,
+) -> Insert:
+    """Build the INSERT ... SELECT that writes the complete drafts in scope to the complete table."""
+
+    names, rows = promotion_rows(draft_model, complete_model, scope)
+    complete_table = model_table(complete_model)
+
+    if mode is PromotionMode.INSERT:
+        statement = insert(complete_table).from_select([complete_table.c[name] for name in names], rows)
+    else:
+        statement = _upsert_statement(dialect, complete_table, names, rows)
+
+    # The keys of the written rows let a LookupCache on the complete table evict exactly those.
+    if caches_of(complete_table):
+        return statement.returning(*complete_table.primary_key.columns)
+
+    return statement
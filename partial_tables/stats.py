@@ -0,0 +1,82 @@
+from sqlalchemy import ColumnElement, func, select, tablesample, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import ClauseAdapter
+
+from partial_tables.execution import Steps, async_run_steps, run_steps
+from partial_tables.models.stats import CompletionReport, FieldCompletion
+from partial_tables.pairing import model_table
+from partial_tables.partial_table import PartialTable
+
+
+def _stats_steps(
+    dialect: str,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None,
+    sample_percent: float | None,
+) -> Steps[CompletionReport]:
+    if not issubclass(draft_model, PartialTable):
+        raise ValueError(f"{draft_model.__name__} is not a PartialTable")
+
+    table = model_table(draft_model)
+    names = draft_model.__partial_fields__
+
+    statement = select(
+        func.count(),
+        func.count().filter(draft_model.is_complete),
+        *(func.count(table.c[name]) for name in names),
+    ).where(true() if where is None else where)
+
+    if sample_percent is not None:
+        if dialect != "postgresql":
+            raise ValueError(f"TABLESAMPLE is not supported on {dialect}")
+
+        if not 0 < sample_percent <= 100:
+            raise ValueError("sample_percent must be greater than 0 and at most 100")
+
+        # Point every reference to the table, including those in where, at the sample.
+        statement = ClauseAdapter(tablesample(table, func.system(sample_percent))).traverse(statement)
+
+    rows, complete, *filled = (yield statement).one()
+
+    return CompletionReport(
+        rows=rows,
+        complete=complete,
+        fields=[
+            FieldCompletion(name=name, filled=count, fill_rate=count / rows if rows else 0.0)
+            for name, count in zip(names, filled)
+        ],
+        sample_percent=sample_percent,
+    )
+
+
+def completion_stats(
+    session: Session,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    sample_percent: float | None = None,
+) -> CompletionReport:
+    """
+    Count how often each PartialAllowed field of a partial table is filled, in a single scan.
+
+    One aggregate query counts the rows, the complete rows and COUNT(col) of every
+    PartialAllowed field. On PostgreSQL, sample_percent scans only that share of the
+    table's pages with TABLESAMPLE SYSTEM, for approximate rates on huge tables.
+    """
+
+    steps = _stats_steps(session.get_bind().dialect.name, draft_model, where, sample_percent)
+
+    return run_steps(session, steps)
+
+
+async def async_completion_stats(
+    session: AsyncSession,
+    draft_model: type[PartialTable],
+    where: ColumnElement[bool] | None = None,
+    sample_percent: float | None = None,
+) -> CompletionReport:
+    """Async version of completion_stats()."""
+
+    steps = _stats_steps(session.get_bind().dialect.name, draft_model, where, sample_percent)
+
+    return await async_run_steps(session, steps)
@@ -0,0 +1,112 @@
+import threading
+from typing import Final, TypeAlias
+
+from sqlalchemy import delete, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlalchemy.orm.attributes import flag_dirty
+
+from partial_tables.completeness import completeness_checker
+from partial_tables.models.promotion import PromotionMode
+from partial_tables.pairing import model_table, paired_column_names
+from partial_tables.partial_table import PartialTable
+from partial_tables.statements import keys_clause, promotion_statement
+
+# Draft model, complete model, promotion mode and whether the drafts are deleted once promoted.
+SubmissionGroup: TypeAlias = tuple[type[PartialTable], type, PromotionMode, bool]
+
+# session.info key: group -> {id(draft): draft} submitted since the last flush.
+_SUBMITTED: Final[str] = "partial_tables_submitted"
+
+# session.info key: drafts deleted by the running flush, expunged once it completes.
+_PROMOTED: Final[str] = "partial_tables_promoted"
+
+# Guards installing the session listeners.
+_LISTENERS_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _promote_submitted(session: Session, _flush_context: UOWTransaction) -> None:
+    """Promote the drafts submitted since the last flush, with one statement per group."""
+
+    submitted: dict[SubmissionGroup, dict[int, PartialTable]] = session.info.pop(_SUBMITTED, {})
+
+    for (draft_model, complete_model, mode, delete_drafts), flagged in submitted.items():
+        # Drafts deleted or expunged after they were submitted are no longer promoted.
+        drafts = [draft for draft in flagged.values() if draft in session and draft not in session.deleted]
+
+        if not drafts:
+            continue
+
+        checker = completeness_checker(draft_model)
+        incomplete = [draft for draft in drafts if not checker.is_complete(draft)]
+
+        if incomplete:
+            raise ValueError(
+                f"{len(incomplete)} submitted {draft_model.__name__} drafts are not complete, "
+                f"the first one is missing {checker.missing_fields(incomplete[0])}"
+            )
+
+        draft_table = model_table(draft_model)
+        mapper = inspect(draft_model)
+        submitted_drafts = keys_clause(
+            list(draft_table.primary_key.columns),
+            [mapper.primary_key_from_instance(draft) for draft in drafts],
+        )
+        dialect = session.get_bind().dialect.name
+
+        session.execute(promotion_statement(dialect, draft_model, complete_model, submitted_drafts, mode))
+
+        if delete_drafts:
+            session.execute(delete(draft_table).where(submitted_drafts))
+            session.info.setdefault(_PROMOTED, []).extend(drafts)
+
+
+def _expunge_promoted(session: Session, _flush_context: UOWTransaction) -> None:
+    # The rows of these drafts were deleted behind the ORM's back, so the session lets go of them.
+    for draft in session.info.pop(_PROMOTED, []):
+        if draft in session:
+            session.expunge(draft)
+
+
+def _discard_submitted(session: Session) -> None:
+    session.info.pop(_SUBMITTED, None)
+    session.info.pop(_PROMOTED, None)
+
+
+def submit_for_promotion(
+    session: Session | AsyncSession,
+    draft: PartialTable,
+    complete_model: type,
+    mode: PromotionMode = PromotionMode.INSERT,
+    delete_draft: bool = True,
+) -> None:
+    """
+    Flag a draft to be promoted into complete_model when its session next flushes.
+
+    The draft is added to the session. On flush, the drafts submitted for the same
+    pair, mode and delete_draft are promoted with a single INSERT ... SELECT and then
+    deleted with a single DELETE, so approving many drafts costs two statements
+    instead of two per draft. Deleted drafts are expunged from the session. Every
+    submitted draft must be complete when the session flushes, or the flush fails
+    with a ValueError. Rolling back discards the submissions.
+    """
+
+    if isinstance(session, AsyncSession):
+        session = session.sync_session
+
+    draft_model = type(draft)
+    # Fails early for a pair that cannot be promoted.
+    paired_column_names(draft_model, complete_model)
+
+    with _LISTENERS_LOCK:
+        if not event.contains(Session, "after_flush", _promote_submitted):
+            event.listen(Session, "after_flush", _promote_submitted)
+            event.listen(Session, "after_flush_postexec", _expunge_promoted)
+            event.listen(Session, "after_rollback", _discard_submitted)
+
+    session.add(draft)
+    # An unchanged draft would otherwise not make the session flush at all.
+    flag_dirty(draft)
+
+    group = (draft_model, complete_model, mode, delete_draft)
+    session.info.setdefault(_SUBMITTED, {}).setdefault(group, {})[id(draft)] = draft
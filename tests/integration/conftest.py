@@ -1,16 +1,23 @@
 import asyncio
 import time
-from typing import Final
+from typing import Final, TypeAlias
 import pytest
 import pytest_asyncio
 from sqlalchemy_utils import database_exists, create_database
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy import Engine
+from sqlalchemy import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from partial_tables import PartialTable
+from tests.integration.database import sqlalchemy_tables, sqlmodel_tables
 from tests.integration.database.sqlalchemy_tables import SQLAlchemyBusinessBase
 from tests.integration.database.sqlmodel_tables import SQLModelBusinessBase
 
 DATABASE_CONNECTION_MAX_TRIES: Final[int] = 10
 
+# Draft model, complete model and a session on freshly created tables.
+BusinessPair: TypeAlias = tuple[type[PartialTable], type, Session]
+AsyncBusinessPair: TypeAlias = tuple[type[PartialTable], type, AsyncSession]
+
 
 @pytest_asyncio.fixture(scope="session")
 def event_loop(request):
@@ -100,3 +107,67 @@ def sqlmodel_session(
     yield create_session
 
     create_session.close()
+
+
+@pytest.fixture(scope="function", params=["sqlalchemy", "sqlmodel"])
+def business_pair(request: pytest.FixtureRequest) -> BusinessPair:
+    """Return the business draft and complete models of each framework with a session."""
+
+    if request.param == "sqlalchemy":
+        return (
+            sqlalchemy_tables.BusinessDraft,
+            sqlalchemy_tables.Business,
+            request.getfixturevalue("sqlalchemy_session"),
+        )
+
+    return (
+        sqlmodel_tables.BusinessDraft,
+        sqlmodel_tables.Business,
+        request.getfixturevalue("sqlmodel_session"),
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_business_pair(business_pair: BusinessPair, sqlalchemy_connect_url: str) -> AsyncBusinessPair:
+    """Return the business draft and complete models of each framework with an asyncpg session."""
+
+    draft_model, complete_model, _ = business_pair
+    async_engine = create_async_engine(make_url(sqlalchemy_connect_url).set(drivername="postgresql+asyncpg"))
+
+    async with AsyncSession(async_engine) as async_session:
+        yield draft_model, complete_model, async_session
+
+    await async_engine.dispose()
+
+
+@pytest.fixture(scope="function", params=["sqlalchemy", "sqlmodel"])
+def tenant_business_pair(request: pytest.FixtureRequest) -> BusinessPair:
+    """Return the tenant partitioned business draft and complete models of each framework with a session."""
+
+    if request.param == "sqlalchemy":
+        return (
+            sqlalchemy_tables.TenantBusinessDraft,
+            sqlalchemy_tables.TenantBusiness,
+            request.getfixturevalue("sqlalchemy_session"),
+        )
+
+    return (
+        sqlmodel_tables.TenantBusinessDraft,
+        sqlmodel_tables.TenantBusiness,
+        request.getfixturevalue("sqlmodel_session"),
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def async_tenant_business_pair(
+    tenant_business_pair: BusinessPair, sqlalchemy_connect_url: str
+) -> AsyncBusinessPair:
+    """Return the tenant partitioned business models of each framework with an asyncpg session."""
+
+    draft_model, complete_model, _ = tenant_business_pair
+    async_engine = create_async_engine(make_url(sqlalchemy_connect_url).set(drivername="postgresql+asyncpg"))
+
+    async with AsyncSession(async_engine) as async_session:
+        yield draft_model, complete_model, async_session
+
+    await async_engine.dispose()
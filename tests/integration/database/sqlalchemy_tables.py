@@ -1,12 +1,35 @@
+import enum
+from datetime import datetime
 from typing import Annotated
+from sqlalchemy import JSON, DateTime, Enum
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from partial_tables import PartialSQLAlchemyMixin, PartialAllowed, PartialTable
+from partial_tables import (
+    PartialAllowed,
+    PartialPartition,
+    PartialPartitioning,
+    PartialSQLAlchemyMixin,
+    PartialStorage,
+    PartialTable,
+    PartitionMethod,
+)
 
 __all__ = [
     "SQLAlchemyBusinessBase",
     "BusinessBase",
     "BusinessDraft",
     "Business",
+    "IndexedBusinessDraft",
+    "TriggerBusinessDraft",
+    "SparseBusinessDraft",
+    "TunedBusinessDraft",
+    "TenantBusinessBase",
+    "TenantBusinessDraft",
+    "TenantBusiness",
+    "BusinessProfile",
+    "Rating",
+    "Visit",
+    "BusinessInspectionDraft",
 ]
 
 
@@ -33,3 +56,91 @@ class BusinessDraft(BusinessBase, PartialTable):
 
 class Business(BusinessBase):
     __tablename__ = "business"
+
+
+class IndexedBusinessDraft(BusinessBase, PartialTable):
+    __tablename__ = "indexed_business_draft"
+    __partial_complete_column__ = True
+    __partial_mask_column__ = True
+
+
+class TriggerBusinessDraft(BusinessBase, PartialTable):
+    __tablename__ = "trigger_business_draft"
+    __partial_mask_column__ = True
+    __partial_mask_trigger__ = True
+
+
+class SparseBusinessDraft(BusinessBase, PartialTable):
+    __tablename__ = "sparse_business_draft"
+    __partial_sparse_indexes__ = True
+
+
+class TunedBusinessDraft(BusinessBase, PartialTable):
+    __tablename__ = "tuned_business_draft"
+    __partial_storage__ = PartialStorage(
+        fillfactor=70, autovacuum={"vacuum_scale_factor": 0.01, "enabled": True}, unlogged=True
+    )
+
+
+class TenantBusinessBase(PartialSQLAlchemyMixin, SQLAlchemyBusinessBase):
+    """Base class for business models partitioned by tenant."""
+
+    __abstract__ = True
+
+    tenant: Mapped[str] = mapped_column(primary_key=True)
+    business_id: Mapped[int] = mapped_column(primary_key=True)
+    business_name: Mapped[str] = mapped_column()
+    city: Mapped[Annotated[str, PartialAllowed()]] = mapped_column()
+    address: Mapped[Annotated[str, PartialAllowed()]] = mapped_column(index=True)
+
+
+class TenantBusinessDraft(TenantBusinessBase, PartialTable):
+    __tablename__ = "tenant_business_draft"
+    __partial_mask_column__ = True
+    __partial_mask_trigger__ = True
+    __partial_sparse_indexes__ = True
+    __partial_storage__ = PartialStorage(fillfactor=70)
+    __partial_partitioning__ = PartialPartitioning(
+        method=PartitionMethod.LIST,
+        column="tenant",
+        partitions=[
+            PartialPartition(name="acme", values=["acme"]),
+            PartialPartition(name="globex", values=["globex"]),
+            PartialPartition(name="other", default=True),
+        ],
+    )
+
+
+class TenantBusiness(TenantBusinessBase):
+    __tablename__ = "tenant_business"
+
+
+class BusinessProfile(SQLAlchemyBusinessBase):
+    __tablename__ = "business_profile"
+
+    business_id: Mapped[int] = mapped_column(primary_key=True)
+    hours: Mapped[dict] = mapped_column(JSON)
+    links: Mapped[dict] = mapped_column(MutableDict.as_mutable(JSON))
+
+
+class Rating(enum.Enum):
+    GOOD = 1
+    BAD = 2
+    EXCELLENT = 1
+
+
+class Visit(enum.Enum):
+    ON_SITE = "on-site"
+    REMOTE = "remote"
+
+
+class BusinessInspectionDraft(PartialSQLAlchemyMixin, SQLAlchemyBusinessBase, PartialTable):
+    __tablename__ = "business_inspection_draft"
+
+    inspection_id: Mapped[int] = mapped_column(primary_key=True)
+    rating: Mapped[Annotated[Rating, PartialAllowed()]] = mapped_column(Enum(Rating))
+    visit: Mapped[Visit] = mapped_column(
+        Enum(Visit, values_callable=lambda visits: [v.value for v in visits])
+    )
+    inspected_at: Mapped[Annotated[datetime, PartialAllowed()]] = mapped_column(DateTime(timezone=True))
+    scheduled_at: Mapped[datetime] = mapped_column(DateTime)
@@ -2,15 +2,30 @@ from typing import Annotated
 
 from sqlmodel import Field, SQLModel
 
-from partial_tables import PartialAllowed, PartialSQLModelMixin, PartialTable
+from partial_tables import (
+    PartialAllowed,
+    PartialPartition,
+    PartialPartitioning,
+    PartialSQLModelMixin,
+    PartialStorage,
+    PartialTable,
+    PartitionMethod,
+)
 
 __all__ = [
     "SQLModelBusinessBase",
     "BusinessDraft",
     "Business",
+    "IndexedBusinessDraft",
+    "TriggerBusinessDraft",
+    "SparseBusinessDraft",
+    "TunedBusinessDraft",
     "OverrideBusinessBase",
     "OverrideBusinessDraft",
     "OverrideBusiness",
+    "TenantBusinessBase",
+    "TenantBusinessDraft",
+    "TenantBusiness",
 ]
 
 
@@ -31,6 +46,30 @@ class Business(SQLModelBusinessBase, table=True):
     __tablename__ = "business"
 
 
+class IndexedBusinessDraft(SQLModelBusinessBase, PartialTable, table=True):
+    __tablename__ = "indexed_business_draft"
+    __partial_complete_column__ = True
+    __partial_mask_column__ = True
+
+
+class TriggerBusinessDraft(SQLModelBusinessBase, PartialTable, table=True):
+    __tablename__ = "trigger_business_draft"
+    __partial_mask_column__ = True
+    __partial_mask_trigger__ = True
+
+
+class SparseBusinessDraft(SQLModelBusinessBase, PartialTable, table=True):
+    __tablename__ = "sparse_business_draft"
+    __partial_sparse_indexes__ = True
+
+
+class TunedBusinessDraft(SQLModelBusinessBase, PartialTable, table=True):
+    __tablename__ = "tuned_business_draft"
+    __partial_storage__ = PartialStorage(
+        fillfactor=70, autovacuum={"vacuum_scale_factor": 0.01, "enabled": True}, unlogged=True
+    )
+
+
 class OverrideBusinessBase(PartialSQLModelMixin, SQLModel):
     """Base model whose partial table redeclares one of its fields."""
 
@@ -46,3 +85,34 @@ class OverrideBusinessDraft(OverrideBusinessBase, PartialTable, table=True):
 
 class OverrideBusiness(OverrideBusinessBase, table=True):
     __tablename__ = "override_business"
+
+
+class TenantBusinessBase(PartialSQLModelMixin, SQLModel):
+    """Base model of the business tables partitioned by tenant."""
+
+    tenant: str = Field(primary_key=True)
+    business_id: int = Field(primary_key=True)
+    business_name: str
+    city: Annotated[str, PartialAllowed()]
+    address: Annotated[str, PartialAllowed()] = Field(index=True)
+
+
+class TenantBusinessDraft(TenantBusinessBase, PartialTable, table=True):
+    __tablename__ = "tenant_business_draft"
+    __partial_mask_column__ = True
+    __partial_mask_trigger__ = True
+    __partial_sparse_indexes__ = True
+    __partial_storage__ = PartialStorage(fillfactor=70)
+    __partial_partitioning__ = PartialPartitioning(
+        method=PartitionMethod.LIST,
+        column="tenant",
+        partitions=[
+            PartialPartition(name="acme", values=["acme"]),
+            PartialPartition(name="globex", values=["globex"]),
+            PartialPartition(name="other", default=True),
+        ],
+    )
+
+
+class TenantBusiness(TenantBusinessBase, table=True):
+    __tablename__ = "tenant_business"
@@ -0,0 +1,205 @@
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from partial_tables import CacheStats, LookupCache, PromotionMode, lookup_cache, promote
+from partial_tables import cache as cache_module
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+from tests.integration.database.sqlalchemy_tables import BusinessProfile
+
+
+@pytest.fixture(scope="function")
+def business_cache(business_pair: BusinessPair) -> LookupCache:
+    """Return the emptied lookup cache of the complete business table."""
+
+    _, complete_model, _ = business_pair
+    cache = lookup_cache(complete_model)
+    cache.clear()
+
+    return cache
+
+
+class TestLookupCache:
+    """Test the read-through primary key cache of complete tables."""
+
+    def _publish(self, business_pair: BusinessPair, count: int) -> None:
+        """Publish count businesses."""
+
+        _, complete_model, session = business_pair
+        session.add_all(
+            complete_model(
+                business_id=key, business_name=f"Business {key}", city=f"City {key}", address="Address"
+            )
+            for key in range(1, count + 1)
+        )
+        session.commit()
+
+    def _name(self, business_pair: BusinessPair, cache: LookupCache, key: int) -> str:
+        """Look a business up from a new session and return its name."""
+
+        _, _, session = business_pair
+
+        with Session(session.get_bind()) as lookup_session:
+            return cache.get(lookup_session, key).business_name
+
+    def test_serves_repeated_lookups(self, business_pair: BusinessPair, business_cache: LookupCache):
+        """Test that only the first lookup of a row reaches the database."""
+
+        _, complete_model, session = business_pair
+        self._publish(business_pair, 1)
+
+        assert self._name(business_pair, business_cache, 1) == "Business 1"
+
+        with Session(session.get_bind()) as lookup_session:
+            business = business_cache.get(lookup_session, 1)
+
+            assert business in lookup_session
+            assert (business.business_id, business.city) == (1, "City 1")
+
+        assert business_cache.get(session, 2) is None
+        assert business_cache.stats() == CacheStats(hits=1, misses=2, evictions=0, size=1)
+        assert business_cache.stats().hit_rate == pytest.approx(1 / 3)
+        assert lookup_cache(complete_model) is business_cache
+
+    def test_flush_evicts_written_rows(self, business_pair: BusinessPair, business_cache: LookupCache):
+        """Test that committing an ORM change to a cached row evicts only that row."""
+
+        _, _, session = business_pair
+        self._publish(business_pair, 2)
+        self._name(business_pair, business_cache, 1)
+        self._name(business_pair, business_cache, 2)
+
+        with Session(session.get_bind()) as write_session:
+            business_cache.get(write_session, 1).business_name = "Renamed"
+            write_session.commit()
+
+        assert self._name(business_pair, business_cache, 1) == "Renamed"
+        assert business_cache.stats() == CacheStats(hits=1, misses=3, evictions=1, size=2)
+
+    def test_promotion_evicts_promoted_rows(self, business_pair: BusinessPair, business_cache: LookupCache):
+        """Test that promoting a draft over a published row evicts exactly that row."""
+
+        draft_model, _, session = business_pair
+        self._publish(business_pair, 2)
+        self._name(business_pair, business_cache, 1)
+        self._name(business_pair, business_cache, 2)
+
+        session.add(draft_model(business_id=1, business_name="Approved", city="City 1", address="Address"))
+        session.commit()
+        promote(session, draft_model, business_pair[1], mode=PromotionMode.UPSERT)
+        session.commit()
+
+        assert self._name(business_pair, business_cache, 1) == "Approved"
+        assert self._name(business_pair, business_cache, 2) == "Business 2"
+        assert business_cache.stats().evictions == 1
+
+    def test_promotion_only_returns_keys_to_cached_tables(
+        self, business_pair: BusinessPair, business_cache: LookupCache, tenant_business_pair: BusinessPair
+    ):
+        """Test that promotions only fetch the promoted keys when the complete table has a cache."""
+
+        statements = []
+
+        def record(_connection, _cursor, statement, *_args):
+            statements.append(statement)
+
+        for draft_model, complete_model, session in (business_pair, tenant_business_pair):
+            event.listen(session.get_bind(), "before_cursor_execute", record)
+
+            try:
+                promote(session, draft_model, complete_model)
+            finally:
+                event.remove(session.get_bind(), "before_cursor_execute", record)
+
+        business_insert, tenant_insert = (
+            statement for statement in statements if statement.startswith("INSERT")
+        )
+
+        assert "RETURNING" in business_insert
+        assert "RETURNING" not in tenant_insert
+
+    def test_uncommitted_writes_stay_in_their_session(
+        self, business_pair: BusinessPair, business_cache: LookupCache
+    ):
+        """Test that a session sees its own uncommitted writes while other sessions keep the cached row."""
+
+        _, complete_model, session = business_pair
+        self._publish(business_pair, 1)
+        self._name(business_pair, business_cache, 1)
+
+        session.execute(update(complete_model).values(business_name="Pending"))
+
+        assert business_cache.get(session, 1).business_name == "Pending"
+        assert self._name(business_pair, business_cache, 1) == "Business 1"
+
+        session.commit()
+
+        assert self._name(business_pair, business_cache, 1) == "Pending"
+
+    def test_mutating_a_hit_leaves_the_entry_alone(self, sqlalchemy_session: Session):
+        """Test that mutating the JSON value of a cached row changes neither the cache nor other sessions."""
+
+        cache = lookup_cache(BusinessProfile)
+        cache.clear()
+        sqlalchemy_session.add(BusinessProfile(business_id=1, hours={"monday": "9-5"}, links={"web": "a"}))
+        sqlalchemy_session.commit()
+
+        for _ in range(2):
+            with Session(sqlalchemy_session.get_bind()) as lookup_session:
+                profile = cache.get(lookup_session, 1)
+                profile.hours["monday"] = "closed"
+                profile.links["web"] = "b"
+
+                assert profile in lookup_session.dirty
+
+        with Session(sqlalchemy_session.get_bind()) as lookup_session:
+            profile = cache.get(lookup_session, 1)
+
+            assert (profile.hours, profile.links) == ({"monday": "9-5"}, {"web": "a"})
+
+        assert cache.stats() == CacheStats(hits=2, misses=1, evictions=0, size=1)
+
+    def test_evicts_least_recently_used_and_expired_rows(
+        self, business_pair: BusinessPair, business_cache: LookupCache, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the cache stays within maxsize and drops entries older than ttl."""
+
+        now = [0.0]
+        monkeypatch.setattr(business_cache, "maxsize", 2)
+        monkeypatch.setattr(business_cache, "ttl", 10.0)
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        self._publish(business_pair, 3)
+
+        for key in (1, 2, 1, 3):
+            self._name(business_pair, business_cache, key)
+
+        assert business_cache.stats() == CacheStats(hits=1, misses=3, evictions=1, size=2)
+
+        now[0] = 11.0
+        self._name(business_pair, business_cache, 1)
+
+        assert business_cache.stats() == CacheStats(hits=1, misses=4, evictions=2, size=2)
+
+    def test_rejects_partial_table(self, business_pair: BusinessPair):
+        """Test that only complete tables can be cached."""
+
+        draft_model, _, _ = business_pair
+
+        with pytest.raises(ValueError, match="is a PartialTable"):
+            lookup_cache(draft_model)
+
+    @pytest.mark.asyncio
+    async def test_async_get(self, async_business_pair: AsyncBusinessPair, business_pair: BusinessPair):
+        """Test that async_get serves the second lookup of a row from the cache."""
+
+        _, complete_model, session = async_business_pair
+        cache = lookup_cache(complete_model)
+        cache.clear()
+        self._publish(business_pair, 1)
+
+        assert (await cache.async_get(session, 1)).business_name == "Business 1"
+
+        session.expunge_all()
+
+        assert (await cache.async_get(session, 1)).business_name == "Business 1"
+        assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=1)
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from partial_tables import async_checkout, checkout
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+from tests.integration.database.sqlalchemy_tables import Business, IndexedBusinessDraft
+
+
+class TestCheckout:
+    """Test the set-based checkout of published rows into drafts."""
+
+    def _publish(self, business_pair: BusinessPair, count: int) -> None:
+        """Publish count businesses and draft the first one."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            complete_model(
+                business_id=key, business_name=f"Business {key}", city=f"City {key}", address="Address"
+            )
+            for key in range(1, count + 1)
+        )
+        session.add(draft_model(business_id=1, business_name="Edited", city=None, address=None))
+        session.commit()
+
+    def test_copies_published_rows_without_overwriting_drafts(self, business_pair: BusinessPair):
+        """Test that published rows are copied and existing drafts are kept."""
+
+        draft_model, complete_model, session = business_pair
+        self._publish(business_pair, 3)
+
+        result = checkout(session, draft_model, complete_model, where=complete_model.business_id < 3)
+        session.commit()
+
+        assert (result.checked_out, result.existing) == (1, 1)
+        assert session.execute(
+            select(draft_model.business_id, draft_model.business_name).order_by(draft_model.business_id)
+        ).all() == [(1, "Edited"), (2, "Business 2")]
+
+    def test_checkout_in_batches(self, business_pair: BusinessPair):
+        """Test that a batched checkout copies every published row."""
+
+        draft_model, complete_model, session = business_pair
+        self._publish(business_pair, 5)
+
+        result = checkout(session, draft_model, complete_model, batch_size=2)
+
+        assert (result.checked_out, result.existing) == (4, 1)
+        assert session.scalars(select(draft_model.business_id).order_by(draft_model.business_id)).all() == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    def test_fills_the_filled_mask(self, sqlalchemy_session: Session):
+        """Test that drafts checked out into a table with a filled_mask column have every bit set."""
+
+        sqlalchemy_session.add(
+            Business(business_id=1, business_name="Business 1", city="City", address="Address")
+        )
+        sqlalchemy_session.commit()
+
+        checkout(sqlalchemy_session, IndexedBusinessDraft, Business)
+        sqlalchemy_session.commit()
+
+        draft = sqlalchemy_session.get(IndexedBusinessDraft, 1)
+
+        assert (draft.filled_mask, draft.is_complete) == (0b11, True)
+
+    @pytest.mark.asyncio
+    async def test_async_checkout(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_checkout copies published rows."""
+
+        draft_model, complete_model, session = async_business_pair
+        session.add(
+            complete_model(business_id=1, business_name="Business 1", city="City 1", address="Address")
+        )
+        await session.commit()
+
+        result = await async_checkout(session, draft_model, complete_model)
+
+        assert result.checked_out == 1
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pytest
+from sqlalchemy.orm import Session
+
+from partial_tables import (
+    async_iter_numpy_batches,
+    iter_arrow_batches,
+    iter_numpy_batches,
+)
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+from tests.integration.database.sqlalchemy_tables import BusinessInspectionDraft, Rating, Visit
+
+
+class TestColumnarExport:
+    """Test the Arrow and NumPy export of partial tables."""
+
+    def _add_drafts(self, business_pair: BusinessPair) -> None:
+        """Add three drafts, one of them complete."""
+
+        draft_model, _, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=1, business_name="Business 1", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="Business 2", city=None, address="Address 2"),
+                draft_model(business_id=3, business_name="Business 3", city="City 3", address=None),
+            ]
+        )
+        session.commit()
+
+    def test_arrow_batches_are_chunked(self, business_pair: BusinessPair):
+        """Test that Arrow batches are chunked, keep NULLs and carry the completeness mask."""
+
+        draft_model, _, session = business_pair
+        self._add_drafts(business_pair)
+
+        batches = list(iter_arrow_batches(session, draft_model, chunk_size=2))
+        table = pa.Table.from_batches(batches)
+
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert table.sort_by("business_id").to_pydict() == {
+            "business_id": [1, 2, 3],
+            "business_name": ["Business 1", "Business 2", "Business 3"],
+            "city": ["City 1", None, "City 3"],
+            "address": ["Address 1", "Address 2", None],
+            "is_complete": [True, False, False],
+        }
+
+    def test_arrow_batches_keep_enum_labels_and_timezones(self, sqlalchemy_session: Session):
+        """Test that Enum members become their stored labels and aware timestamps stay in UTC."""
+
+        scheduled_at = datetime(2024, 5, 1, 9, 30)
+        sqlalchemy_session.add_all(
+            [
+                BusinessInspectionDraft(
+                    inspection_id=1,
+                    rating=Rating.GOOD,
+                    visit=Visit.REMOTE,
+                    inspected_at=datetime(2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+                    scheduled_at=scheduled_at,
+                ),
+                BusinessInspectionDraft(
+                    inspection_id=2,
+                    rating=Rating.EXCELLENT,
+                    visit=Visit.ON_SITE,
+                    inspected_at=None,
+                    scheduled_at=scheduled_at,
+                ),
+                BusinessInspectionDraft(
+                    inspection_id=3,
+                    rating=None,
+                    visit=Visit.REMOTE,
+                    inspected_at=None,
+                    scheduled_at=scheduled_at,
+                ),
+            ]
+        )
+        sqlalchemy_session.commit()
+
+        table = pa.Table.from_batches(iter_arrow_batches(sqlalchemy_session, BusinessInspectionDraft))
+
+        assert table.schema.field("rating").type == pa.string()
+        assert table.schema.field("inspected_at").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("scheduled_at").type == pa.timestamp("us")
+        assert table.sort_by("inspection_id").to_pydict() == {
+            "inspection_id": [1, 2, 3],
+            "rating": ["GOOD", "GOOD", None],
+            "visit": ["remote", "on-site", "remote"],
+            "inspected_at": [datetime(2024, 5, 1, 10, tzinfo=timezone.utc), None, None],
+            "scheduled_at": [scheduled_at] * 3,
+            "is_complete": [True, False, False],
+        }
+
+    def test_numpy_batches_have_validity_masks(self, business_pair: BusinessPair):
+        """Test that NumPy batches have a validity mask per nullable column and a completeness mask."""
+
+        draft_model, _, session = business_pair
+        self._add_drafts(business_pair)
+
+        (batch,) = iter_numpy_batches(session, draft_model, where=draft_model.business_id < 3)
+        order = batch.columns["business_id"].argsort()
+
+        assert batch.columns["business_id"].dtype == "int64"
+        assert set(batch.valid) == {"city", "address"}
+        assert batch.valid["city"][order].tolist() == [True, False]
+        assert batch.complete[order].tolist() == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_async_numpy_batches(self, async_business_pair: AsyncBusinessPair):
+        """Test that the async export streams the same batches."""
+
+        draft_model, _, session = async_business_pair
+        session.add(draft_model(business_id=1, business_name="Business 1", city="City 1", address=None))
+        await session.commit()
+
+        batches = [batch async for batch in async_iter_numpy_batches(session, draft_model)]
+
+        assert [batch.complete.tolist() for batch in batches] == [[False]]
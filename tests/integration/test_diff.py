@@ -0,0 +1,75 @@
+import pytest
+
+from partial_tables import async_diff_drafts, diff_drafts
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+
+
+class TestDiffDrafts:
+    """Test the SQL-side draft to published diff."""
+
+    def test_reports_changed_columns_of_drafts(self, business_pair: BusinessPair):
+        """Test that only drafts that differ are returned with a bitmask of their changed columns."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                complete_model(business_id=1, business_name="Same", city="City 1", address="Address 1"),
+                complete_model(business_id=2, business_name="Old name", city="City 2", address="Address 2"),
+                draft_model(business_id=1, business_name="Same", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="New name", city="City 2", address=None),
+                draft_model(business_id=3, business_name="New", city="City 3", address=None),
+            ]
+        )
+        session.commit()
+
+        report = diff_drafts(session, draft_model, complete_model)
+
+        assert report.columns == ("business_name", "city", "address")
+        assert [(diff.key, diff.published, report.changed_columns(diff)) for diff in report.diffs] == [
+            ((2,), True, ["business_name", "address"]),
+            ((3,), False, ["business_name", "city"]),
+        ]
+        assert report.diffs[0].changed_mask == 0b101
+        assert all(diff.changed_values == {} for diff in report.diffs)
+
+    def test_include_values_returns_only_changed_values(self, business_pair: BusinessPair):
+        """Test that include_values returns the draft values of the changed columns only."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                complete_model(business_id=1, business_name="Old name", city="City 1", address="Address 1"),
+                draft_model(business_id=1, business_name="New name", city="City 1", address=None),
+                draft_model(business_id=2, business_name="Filtered out", city="City 2", address=None),
+            ]
+        )
+        session.commit()
+
+        report = diff_drafts(
+            session,
+            draft_model,
+            complete_model,
+            where=draft_model.business_id == 1,
+            include_values=True,
+        )
+
+        assert [diff.changed_values for diff in report.diffs] == [
+            {"business_name": "New name", "address": None}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_diff_drafts(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_diff_drafts reports the same changes as the sync version."""
+
+        draft_model, complete_model, session = async_business_pair
+        session.add_all(
+            [
+                complete_model(business_id=1, business_name="Old name", city="City 1", address="Address 1"),
+                draft_model(business_id=1, business_name="New name", city="City 1", address="Address 1"),
+            ]
+        )
+        await session.commit()
+
+        report = await async_diff_drafts(session, draft_model, complete_model)
+
+        assert [report.changed_columns(diff) for diff in report.diffs] == [["business_name"]]
@@ -0,0 +1,152 @@
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from partial_tables import async_ingest_drafts, ingest_drafts
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+from tests.integration.database.sqlalchemy_tables import IndexedBusinessDraft
+
+
+class TestIngestDrafts:
+    """Test the non-NULL merging bulk ingest."""
+
+    def test_sources_fill_different_fields(self, business_pair: BusinessPair):
+        """Test that a NULL from one source never erases a value another source filled."""
+
+        draft_model, _, session = business_pair
+
+        assert (
+            ingest_drafts(
+                session, draft_model, [{"business_id": 1, "business_name": "Business 1", "city": "City 1"}]
+            )
+            == 1
+        )
+        assert (
+            ingest_drafts(
+                session,
+                draft_model,
+                [{"business_id": 1, "business_name": "Renamed", "city": None, "address": "Address 1"}],
+            )
+            == 1
+        )
+        session.commit()
+
+        draft = session.get(draft_model, 1)
+
+        assert (draft.business_name, draft.city, draft.address) == ("Renamed", "City 1", "Address 1")
+
+    def test_rows_are_merged_and_chunked(self, business_pair: BusinessPair, monkeypatch: pytest.MonkeyPatch):
+        """Test that repeated keys in a batch are merged and that statements stay under the parameter limit."""
+
+        draft_model, _, session = business_pair
+        monkeypatch.setattr(session.get_bind().dialect, "insertmanyvalues_max_parameters", 8)
+        rows = [
+            {"business_id": key, "business_name": f"Business {key}", "city": f"City {key}", "address": None}
+            for key in range(1, 6)
+        ]
+        rows.append({"business_id": 1, "business_name": "Business 1", "city": None, "address": "Address 1"})
+
+        assert ingest_drafts(session, draft_model, rows) == 5
+        session.commit()
+
+        assert session.execute(
+            select(draft_model.city, draft_model.address).order_by(draft_model.business_id)
+        ).all()[:2] == [("City 1", "Address 1"), ("City 2", None)]
+
+    def test_rows_with_reordered_keys_share_a_statement(self, business_pair: BusinessPair):
+        """Test that rows with the same columns in a different order are written by one statement."""
+
+        draft_model, _, session = business_pair
+        statements = []
+
+        def record(_connection, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(session.get_bind(), "before_cursor_execute", record)
+
+        try:
+            ingest_drafts(
+                session,
+                draft_model,
+                [
+                    {"business_id": 1, "business_name": "Business 1", "city": "City 1"},
+                    {"city": "City 2", "business_name": "Business 2", "business_id": 2},
+                ],
+            )
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", record)
+
+        assert sum(statement.startswith("INSERT INTO business_draft ") for statement in statements) == 1
+        assert session.scalars(select(draft_model.city).order_by(draft_model.business_id)).all() == [
+            "City 1",
+            "City 2",
+        ]
+
+    def test_rows_require_primary_key(self, business_pair: BusinessPair):
+        """Test that rows without their primary key are rejected."""
+
+        draft_model, _, session = business_pair
+
+        with pytest.raises(ValueError):
+            ingest_drafts(session, draft_model, [{"business_name": "Business 1"}])
+
+    def test_filled_mask_is_kept_current(self, sqlalchemy_session: Session):
+        """Test that ingest keeps the filled_mask column in sync with the merged fields."""
+
+        ingest_drafts(
+            sqlalchemy_session, IndexedBusinessDraft, [{"business_id": 1, "business_name": "B", "city": "C"}]
+        )
+        ingest_drafts(
+            sqlalchemy_session,
+            IndexedBusinessDraft,
+            [{"business_id": 1, "business_name": "B", "address": "A"}],
+        )
+        sqlalchemy_session.commit()
+
+        assert sqlalchemy_session.get(IndexedBusinessDraft, 1).filled_mask == 0b11
+
+    def test_masked_rows_stay_under_the_parameter_limit(
+        self, sqlalchemy_session: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the filled_mask update adds no bind parameters to the chunked statements."""
+
+        engine = sqlalchemy_session.get_bind()
+        monkeypatch.setattr(engine.dialect, "insertmanyvalues_max_parameters", 10)
+        parameter_counts = []
+
+        def record(_connection, _cursor, statement, parameters, *_args):
+            if statement.startswith("INSERT INTO indexed_business_draft "):
+                parameter_counts.append(len(parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+
+        try:
+            ingest_drafts(
+                sqlalchemy_session,
+                IndexedBusinessDraft,
+                [
+                    {"business_id": key, "business_name": f"B{key}", "city": f"C{key}", "address": None}
+                    for key in range(1, 6)
+                ],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert parameter_counts == [10, 10, 5]
+        assert sqlalchemy_session.get(IndexedBusinessDraft, 5).filled_mask == 0b01
+
+    @pytest.mark.asyncio
+    async def test_async_ingest_drafts(self, async_business_pair: AsyncBusinessPair):
+        """Test that the async ingest merges like the sync version."""
+
+        draft_model, _, session = async_business_pair
+
+        await async_ingest_drafts(
+            session, draft_model, [{"business_id": 1, "business_name": "B", "city": "C"}]
+        )
+        await async_ingest_drafts(
+            session, draft_model, [{"business_id": 1, "business_name": "B", "city": None}]
+        )
+        await session.commit()
+
+        assert (await session.get(draft_model, 1)).city == "C"
@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import func, select, text
+
+from partial_tables import (
+    async_create_partitions,
+    completion_stats,
+    create_partitions,
+    partition_clause,
+    promote_claimed,
+)
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+
+TENANTS = ("acme", "globex", "initech", "umbrella")
+
+
+class TestPartitioning:
+    """Test the per-partition utilities of partitioned partial tables."""
+
+    def _add_drafts(self, tenant_business_pair: BusinessPair) -> None:
+        """Add one complete and one incomplete draft for every tenant."""
+
+        draft_model, _, session = tenant_business_pair
+        session.add_all(
+            draft_model(
+                tenant=tenant,
+                business_id=key,
+                business_name=f"Business {key}",
+                city=f"City {key}",
+                address=None if key == 2 else "Address",
+            )
+            for tenant in TENANTS
+            for key in (1, 2)
+        )
+        session.commit()
+
+    def test_partition_clause_matches_partition_rows(self, tenant_business_pair: BusinessPair):
+        """Test that each partition clause selects exactly the rows stored in that partition."""
+
+        draft_model, _, session = tenant_business_pair
+        self._add_drafts(tenant_business_pair)
+
+        for name in ("acme", "globex", "other"):
+            tenants = session.scalars(
+                select(draft_model.tenant).where(partition_clause(draft_model, name)).distinct()
+            ).all()
+            stored = session.scalars(text(f"SELECT DISTINCT tenant FROM tenant_business_draft_{name}")).all()
+
+            assert sorted(tenants) == sorted(stored)
+
+        assert completion_stats(session, draft_model, where=partition_clause(draft_model, "other")).rows == 4
+
+    def test_partition_clause_prunes_partitions(self, tenant_business_pair: BusinessPair):
+        """Test that PostgreSQL only scans the partition a clause targets, the default one included."""
+
+        draft_model, _, session = tenant_business_pair
+
+        for name in ("globex", "other"):
+            statement = (
+                select(func.count()).select_from(draft_model).where(partition_clause(draft_model, name))
+            )
+            compiled = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+            scanned = {
+                partition
+                for line in session.scalars(text(f"EXPLAIN {compiled}"))
+                for partition in ("acme", "globex", "other")
+                if f"tenant_business_draft_{partition}" in line
+            }
+
+            assert scanned == {name}
+
+    def test_partition_clause_rejects_unknown_partition(self, tenant_business_pair: BusinessPair):
+        """Test that a partition that is not declared is rejected."""
+
+        draft_model, complete_model, _ = tenant_business_pair
+
+        with pytest.raises(ValueError, match="not a partition"):
+            partition_clause(draft_model, "missing")
+
+        with pytest.raises(ValueError, match="not a PartialTable"):
+            partition_clause(complete_model, "acme")
+
+    def test_promote_claimed_per_partition(self, tenant_business_pair: BusinessPair):
+        """Test that promotion scoped to a partition leaves the other partitions alone."""
+
+        draft_model, complete_model, session = tenant_business_pair
+        self._add_drafts(tenant_business_pair)
+
+        result = promote_claimed(
+            session, draft_model, complete_model, where=partition_clause(draft_model, "other")
+        )
+
+        assert result.promoted == 2
+        assert sorted(session.scalars(select(complete_model.tenant))) == ["initech", "umbrella"]
+        assert session.scalar(select(func.count()).select_from(draft_model)) == 6
+
+        for name in ("acme", "globex"):
+            promote_claimed(session, draft_model, complete_model, where=partition_clause(draft_model, name))
+
+        assert session.scalar(select(func.count()).select_from(complete_model)) == 4
+        assert set(session.scalars(select(draft_model.business_id))) == {2}
+
+    def test_create_partitions(self, tenant_business_pair: BusinessPair):
+        """Test that missing partitions are created with the storage options of the partial table."""
+
+        draft_model, _, session = tenant_business_pair
+        session.execute(text("DROP TABLE tenant_business_draft_globex"))
+
+        assert create_partitions(session, draft_model) == ["tenant_business_draft_globex"]
+        assert create_partitions(session, draft_model) == []
+
+        session.commit()
+
+        assert session.scalar(
+            text("SELECT reloptions FROM pg_class WHERE relname = 'tenant_business_draft_globex'")
+        ) == ["fillfactor=70"]
+
+    @pytest.mark.asyncio
+    async def test_async_create_partitions(self, async_tenant_business_pair: AsyncBusinessPair):
+        """Test that async_create_partitions creates the missing partitions."""
+
+        draft_model, _, session = async_tenant_business_pair
+        await session.execute(text("DROP TABLE tenant_business_draft_acme"))
+
+        assert await async_create_partitions(session, draft_model) == ["tenant_business_draft_acme"]
+
+        await session.commit()
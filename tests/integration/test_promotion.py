@@ -0,0 +1,356 @@
+import importlib
+import multiprocessing
+from typing import Final
+
+import pytest
+from sqlalchemy import create_engine, func, insert, literal_column, select
+from sqlalchemy.orm import Session
+
+from partial_tables import (
+    PartialTable,
+    PromotionMode,
+    PromotionProgress,
+    async_promote,
+    async_promote_claimed,
+    async_promote_in_batches,
+    promote,
+    promote_claimed,
+    promote_in_batches,
+)
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+
+STRESS_WORKERS: Final[int] = 4
+STRESS_DRAFTS: Final[int] = 2000
+
+
+def _promotion_worker(url: str, module_name: str, draft_name: str, complete_name: str) -> int:
+    """Promote claimed drafts from a separate process and return how many it promoted."""
+
+    module = importlib.import_module(module_name)
+    engine = create_engine(url)
+
+    try:
+        with Session(engine) as session:
+            return promote_claimed(
+                session, getattr(module, draft_name), getattr(module, complete_name), batch_size=25
+            ).promoted
+    finally:
+        engine.dispose()
+
+
+class TestPromote:
+    """Test the set-based draft promotion."""
+
+    def test_promotes_complete_drafts_and_skips_incomplete(self, business_pair: BusinessPair):
+        """Test that complete drafts are copied and drafts with NULL partial fields are counted as skipped."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=1, business_name="Complete", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="No city", city=None, address="Address 2"),
+                draft_model(business_id=3, business_name="Empty", city=None, address=None),
+            ]
+        )
+        session.commit()
+
+        result = promote(session, draft_model, complete_model)
+        session.commit()
+
+        assert result.promoted == 1
+        assert result.skipped == 2
+
+        promoted = session.execute(select(complete_model)).scalars().all()
+
+        assert [(b.business_id, b.business_name, b.city, b.address) for b in promoted] == [
+            (1, "Complete", "City 1", "Address 1")
+        ]
+
+    def test_where_limits_promoted_drafts(self, business_pair: BusinessPair):
+        """Test that only drafts matching the where clause are promoted or counted."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=1, business_name="Approved", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="Pending", city="City 2", address="Address 2"),
+                draft_model(business_id=3, business_name="Approved", city=None, address="Address 3"),
+            ]
+        )
+        session.commit()
+
+        result = promote(session, draft_model, complete_model, where=draft_model.business_name == "Approved")
+        session.commit()
+
+        assert result.promoted == 1
+        assert result.skipped == 1
+        assert session.execute(select(complete_model.business_id)).scalars().all() == [1]
+
+    def test_rejects_swapped_pair(self, business_pair: BusinessPair):
+        """Test that passing the complete table as the draft raises an error."""
+
+        draft_model, complete_model, session = business_pair
+
+        with pytest.raises(ValueError):
+            promote(session, complete_model, draft_model)
+
+    def test_upsert_only_rewrites_changed_rows(self, business_pair: BusinessPair):
+        """Test that upsert inserts new drafts, updates changed rows and leaves identical rows untouched."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                complete_model(business_id=1, business_name="Same", city="City 1", address="Address 1"),
+                complete_model(business_id=2, business_name="Old name", city="City 2", address="Address 2"),
+                draft_model(business_id=1, business_name="Same", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="New name", city="City 2", address="Address 2"),
+                draft_model(business_id=3, business_name="New", city="City 3", address="Address 3"),
+            ]
+        )
+        session.commit()
+
+        def _row_versions() -> dict[int, str]:
+            rows = session.execute(select(complete_model.business_id, literal_column("xmin"))).all()
+
+            return {business_id: xmin for business_id, xmin in rows}
+
+        versions_before = _row_versions()
+        result = promote(session, draft_model, complete_model, mode=PromotionMode.UPSERT)
+        session.commit()
+        versions_after = _row_versions()
+
+        assert (result.promoted, result.skipped, result.unchanged) == (2, 0, 1)
+        assert versions_after[1] == versions_before[1]
+        assert versions_after[2] != versions_before[2]
+        assert session.execute(
+            select(complete_model.business_id, complete_model.business_name).order_by(
+                complete_model.business_id
+            )
+        ).all() == [(1, "Same"), (2, "New name"), (3, "New")]
+
+
+class TestPromoteInBatches:
+    """Test the keyset-paginated draft promotion."""
+
+    def _create_drafts(self, draft_model: type[PartialTable], session: Session) -> None:
+        """Create five drafts where the draft with id 3 is incomplete."""
+
+        session.add_all(
+            [
+                draft_model(
+                    business_id=business_id,
+                    business_name=f"Business {business_id}",
+                    city=None if business_id == 3 else f"City {business_id}",
+                    address=f"Address {business_id}",
+                )
+                for business_id in range(1, 6)
+            ]
+        )
+        session.commit()
+
+    def test_promotes_in_key_order_batches(self, business_pair: BusinessPair):
+        """Test that every batch is reported with running totals and the last promoted key."""
+
+        draft_model, complete_model, session = business_pair
+        self._create_drafts(draft_model, session)
+        reported: list[PromotionProgress] = []
+
+        result = promote_in_batches(
+            session, draft_model, complete_model, batch_size=2, on_batch=reported.append
+        )
+
+        assert (result.promoted, result.skipped) == (4, 1)
+        assert [(p.last_key, p.promoted, p.skipped) for p in reported] == [
+            ((2,), 2, 0),
+            ((4,), 3, 1),
+            ((5,), 4, 1),
+        ]
+        assert session.execute(select(complete_model.business_id)).scalars().all() == [1, 2, 4, 5]
+
+    def test_resumes_after_key(self, business_pair: BusinessPair):
+        """Test that a run resumed after a key only promotes the drafts that follow it."""
+
+        draft_model, complete_model, session = business_pair
+        self._create_drafts(draft_model, session)
+
+        result = promote_in_batches(session, draft_model, complete_model, batch_size=10, after=(3,))
+
+        assert (result.promoted, result.skipped) == (2, 0)
+        assert session.execute(select(complete_model.business_id)).scalars().all() == [4, 5]
+
+
+class TestPromoteClaimed:
+    """Test the worker-oriented promotion of claimed drafts."""
+
+    def test_promotes_and_deletes_claimed_drafts(self, business_pair: BusinessPair):
+        """Test that complete drafts are promoted and deleted batch by batch while incomplete ones stay."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                draft_model(
+                    business_id=key, business_name=f"Business {key}", city=f"City {key}", address="Address"
+                )
+                for key in range(1, 6)
+            ]
+            + [draft_model(business_id=6, business_name="Incomplete", city=None, address="Address")]
+        )
+        session.commit()
+
+        result = promote_claimed(session, draft_model, complete_model, batch_size=2)
+
+        assert (result.promoted, result.skipped) == (5, 0)
+        assert session.scalars(select(draft_model.business_id)).all() == [6]
+        assert session.scalar(select(func.count()).select_from(complete_model)) == 5
+
+    def test_marks_instead_of_deleting(self, business_pair: BusinessPair):
+        """Test that mark updates promoted drafts and that max_batches stops the worker early."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=key, business_name="Pending", city=f"City {key}", address="Address")
+                for key in range(1, 4)
+            ]
+        )
+        session.commit()
+
+        result = promote_claimed(
+            session,
+            draft_model,
+            complete_model,
+            where=draft_model.business_name == "Pending",
+            batch_size=2,
+            mark={"business_name": "Promoted"},
+            max_batches=1,
+        )
+
+        assert result.promoted == 2
+        assert session.execute(
+            select(draft_model.business_id, draft_model.business_name).order_by(draft_model.business_id)
+        ).all() == [(1, "Promoted"), (2, "Promoted"), (3, "Pending")]
+
+    def test_marked_drafts_are_not_claimed_again(self, business_pair: BusinessPair):
+        """Test that marking ends the run even when where still matches the marked drafts."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=key, business_name="Pending", city=f"City {key}", address="Address")
+                for key in range(1, 4)
+            ]
+        )
+        session.commit()
+
+        result = promote_claimed(
+            session, draft_model, complete_model, batch_size=2, mark={"business_name": "Promoted"}
+        )
+
+        assert result.promoted == 3
+        assert set(session.scalars(select(draft_model.business_name))) == {"Promoted"}
+
+    def test_concurrent_workers_promote_each_draft_once(
+        self, business_pair: BusinessPair, sqlalchemy_connect_url: str
+    ):
+        """Test that workers in separate processes split the drafts without promoting any twice."""
+
+        draft_model, complete_model, session = business_pair
+        session.execute(
+            insert(draft_model),
+            [
+                {
+                    "business_id": key,
+                    "business_name": f"Business {key}",
+                    "city": f"City {key}",
+                    "address": None if key % 10 == 0 else "Address",
+                }
+                for key in range(1, STRESS_DRAFTS + 1)
+            ],
+        )
+        session.commit()
+        session.close()
+
+        arguments = (
+            sqlalchemy_connect_url,
+            draft_model.__module__,
+            draft_model.__name__,
+            complete_model.__name__,
+        )
+
+        with multiprocessing.get_context("fork").Pool(STRESS_WORKERS) as pool:
+            promoted = pool.starmap(_promotion_worker, [arguments] * STRESS_WORKERS)
+
+        complete_drafts = STRESS_DRAFTS - STRESS_DRAFTS // 10
+
+        assert sum(promoted) == complete_drafts
+        assert session.scalar(select(func.count()).select_from(complete_model)) == complete_drafts
+        assert session.scalar(select(func.count()).select_from(draft_model)) == STRESS_DRAFTS // 10
+
+
+class TestAsyncPromote:
+    """Test the async draft promotion entry points."""
+
+    @pytest.mark.asyncio
+    async def test_async_promote(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_promote copies complete drafts and counts incomplete ones as skipped."""
+
+        draft_model, complete_model, session = async_business_pair
+        session.add_all(
+            [
+                draft_model(business_id=1, business_name="Complete", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="No city", city=None, address="Address 2"),
+            ]
+        )
+        await session.commit()
+
+        result = await async_promote(session, draft_model, complete_model)
+        await session.commit()
+
+        assert (result.promoted, result.skipped) == (1, 1)
+        assert (await session.execute(select(complete_model.business_id))).scalars().all() == [1]
+
+    @pytest.mark.asyncio
+    async def test_async_promote_in_batches(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_promote_in_batches promotes and reports every batch."""
+
+        draft_model, complete_model, session = async_business_pair
+        session.add_all(
+            [
+                draft_model(
+                    business_id=business_id,
+                    business_name=f"Business {business_id}",
+                    city=f"City {business_id}",
+                    address=f"Address {business_id}",
+                )
+                for business_id in range(1, 4)
+            ]
+        )
+        await session.commit()
+        reported: list[PromotionProgress] = []
+
+        result = await async_promote_in_batches(
+            session,
+            draft_model,
+            complete_model,
+            batch_size=2,
+            mode=PromotionMode.UPSERT,
+            on_batch=reported.append,
+        )
+
+        assert result.promoted == 3
+        assert [progress.last_key for progress in reported] == [(2,), (3,)]
+
+    @pytest.mark.asyncio
+    async def test_async_promote_claimed(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_promote_claimed promotes and deletes claimed drafts."""
+
+        draft_model, complete_model, session = async_business_pair
+        session.add(
+            draft_model(business_id=1, business_name="Business 1", city="City 1", address="Address 1")
+        )
+        await session.commit()
+
+        result = await async_promote_claimed(session, draft_model, complete_model)
+
+        assert result.promoted == 1
+        assert (await session.scalars(select(draft_model))).all() == []
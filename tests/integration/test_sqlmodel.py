@@ -1,13 +1,20 @@
 import pytest
-from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, insert, select, text, update
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 
+from partial_tables.partial_table import FILLED_MASK_COLUMN, IS_COMPLETE_COLUMN
 from tests.integration.database.sqlmodel_tables import (
     Business,
     BusinessDraft,
+    IndexedBusinessDraft,
     OverrideBusiness,
     OverrideBusinessDraft,
+    SparseBusinessDraft,
+    TenantBusinessDraft,
+    TriggerBusinessDraft,
+    TunedBusinessDraft,
+    SQLModelBusinessBase,
 )
 
 
@@ -90,6 +97,22 @@ class TestSQLModelPartialTableIntegration:
         assert draft_table.c["city"].nullable is True
         assert draft_table.c["address"].nullable is True
 
+    def test_partial_table_owns_cloned_field_info(self):
+        """Test that inherited partial fields get their own FieldInfo that keeps unique/index options."""
+
+        for name in ("city", "address"):
+            draft_field = BusinessDraft.model_fields[name]
+            base_field = SQLModelBusinessBase.model_fields[name]
+
+            assert draft_field is not base_field
+            assert draft_field.metadata is not base_field.metadata
+            assert base_field.annotation is str
+
+        assert BusinessDraft.__table__.c["city"].unique is True
+        assert BusinessDraft.__table__.c["address"].index is True
+        assert Business.__table__.c["city"].unique is True
+        assert Business.__table__.c["address"].index is True
+
     def test_partial_table_field_redeclaration_overrides_base(self):
         """A field redeclared on the partial table keeps its own options, not the base's."""
 
@@ -150,3 +173,263 @@ class TestSQLModelPartialTableIntegration:
 
         assert new_business.city == "City 2"
         assert new_business.address == "Address 2"
+
+    def test_is_complete_filters_drafts(self, sqlmodel_session: Session):
+        """Test that is_complete is true only for drafts with every PartialAllowed field set."""
+
+        self._create_business(
+            BusinessDraft,
+            sqlmodel_session,
+            business_id=4,
+            business_name="Business 4",
+            city="City 4",
+            address="Address 4",
+        )
+        self._create_business(
+            BusinessDraft,
+            sqlmodel_session,
+            business_id=5,
+            business_name="Business 5",
+            city="City 5",
+            address=None,
+        )
+
+        complete_ids = (
+            sqlmodel_session.execute(select(BusinessDraft.business_id).where(BusinessDraft.is_complete))
+            .scalars()
+            .all()
+        )
+
+        assert complete_ids == [4]
+        assert sqlmodel_session.get(BusinessDraft, 4).is_complete is True
+        assert sqlmodel_session.get(BusinessDraft, 5).is_complete is False
+
+    def test_generated_is_complete_column(self, sqlmodel_session: Session):
+        """Test that the opt-in generated is_complete column is indexed and kept in sync by the database."""
+
+        table = IndexedBusinessDraft.__table__
+
+        assert IS_COMPLETE_COLUMN not in BusinessDraft.__table__.c
+        assert any([c.name for c in idx.columns] == [IS_COMPLETE_COLUMN] for idx in table.indexes)
+
+        self._create_business(
+            IndexedBusinessDraft,
+            sqlmodel_session,
+            business_id=6,
+            business_name="Business 6",
+            city="City 6",
+            address=None,
+        )
+
+        assert sqlmodel_session.execute(select(IndexedBusinessDraft.is_complete)).scalar_one() is False
+
+        sqlmodel_session.execute(update(table).values(address="Address 6"))
+
+        assert (
+            sqlmodel_session.execute(
+                select(IndexedBusinessDraft.business_id).where(IndexedBusinessDraft.is_complete)
+            ).scalar_one()
+            == 6
+        )
+
+    def test_filled_mask_column(self, sqlmodel_session: Session):
+        """Test that the opt-in filled_mask column is indexed and kept current on flush."""
+
+        table = IndexedBusinessDraft.__table__
+
+        assert FILLED_MASK_COLUMN not in BusinessDraft.__table__.c
+        assert any([c.name for c in idx.columns] == [FILLED_MASK_COLUMN] for idx in table.indexes)
+
+        self._create_business(
+            IndexedBusinessDraft,
+            sqlmodel_session,
+            business_id=7,
+            business_name="Business 7",
+            city="City 7",
+            address=None,
+        )
+
+        draft = sqlmodel_session.get(IndexedBusinessDraft, 7)
+
+        assert draft.filled_mask == 0b01
+        assert (
+            sqlmodel_session.execute(
+                select(IndexedBusinessDraft.business_id).where(
+                    IndexedBusinessDraft.missing_exactly("address")
+                )
+            ).scalar_one()
+            == 7
+        )
+
+        draft.address = "Address 7"
+        sqlmodel_session.commit()
+
+        assert draft.filled_mask == 0b11
+        assert sqlmodel_session.execute(
+            select(IndexedBusinessDraft.business_id).where(IndexedBusinessDraft.missing_exactly())
+        ).scalar_one()
+        assert sqlmodel_session.execute(
+            select(IndexedBusinessDraft.business_id).where(IndexedBusinessDraft.missing_at_most("city"))
+        ).scalar_one()
+        assert (
+            sqlmodel_session.execute(
+                select(IndexedBusinessDraft.business_id).where(
+                    IndexedBusinessDraft.missing_exactly("address")
+                )
+            ).scalar_one_or_none()
+            is None
+        )
+
+    def test_missing_helpers_without_mask_column(self, sqlmodel_session: Session):
+        """Test that the missing-field filters fall back to NULL checks without a filled_mask column."""
+
+        self._create_business(
+            BusinessDraft,
+            sqlmodel_session,
+            business_id=8,
+            business_name="Business 8",
+            city=None,
+            address="Address 8",
+        )
+
+        assert (
+            sqlmodel_session.execute(
+                select(BusinessDraft.business_id).where(BusinessDraft.missing_exactly("city"))
+            ).scalar_one()
+            == 8
+        )
+        assert (
+            sqlmodel_session.execute(
+                select(BusinessDraft.business_id).where(BusinessDraft.missing_at_most("address"))
+            ).scalar_one_or_none()
+            is None
+        )
+
+        with pytest.raises(ValueError):
+            BusinessDraft.missing_exactly("business_name")
+
+    def test_filled_mask_trigger(self, sqlmodel_session: Session):
+        """Test that the opt-in trigger keeps filled_mask current for writes that bypass the ORM."""
+
+        table = TriggerBusinessDraft.__table__
+
+        sqlmodel_session.execute(
+            insert(table).values(business_id=9, business_name="Business 9", city="City 9")
+        )
+
+        assert sqlmodel_session.execute(select(table.c.filled_mask)).scalar_one() == 0b01
+
+        sqlmodel_session.execute(update(table).values(city=None, address="Address 9"))
+
+        assert sqlmodel_session.execute(select(table.c.filled_mask)).scalar_one() == 0b10
+
+        self._create_business(
+            TriggerBusinessDraft,
+            sqlmodel_session,
+            business_id=10,
+            business_name="Business 10",
+            city="City 10",
+            address="Address 10",
+        )
+
+        assert sqlmodel_session.get(TriggerBusinessDraft, 10).filled_mask == 0b11
+
+    def test_sparse_indexes(self, sqlmodel_session: Session):
+        """Test that opt-in sparse indexes leave NULLs out while still enforcing uniqueness."""
+
+        indexdefs = sqlmodel_session.scalars(
+            text(
+                "SELECT indexdef FROM pg_indexes WHERE tablename = 'sparse_business_draft' ORDER BY indexname"
+            )
+        ).all()
+
+        assert indexdefs[:2] == [
+            "CREATE INDEX ix_sparse_business_draft_address ON public.sparse_business_draft "
+            "USING btree (address) WHERE (address IS NOT NULL)",
+            "CREATE UNIQUE INDEX ix_sparse_business_draft_city ON public.sparse_business_draft "
+            "USING btree (city) WHERE (city IS NOT NULL)",
+        ]
+        assert any(
+            [c.name for c in constraint.columns] == ["city"] for constraint in Business.__table__.constraints
+        )
+
+        self._create_business(
+            SparseBusinessDraft, sqlmodel_session, business_id=1, business_name="B1", city=None
+        )
+        self._create_business(
+            SparseBusinessDraft, sqlmodel_session, business_id=2, business_name="B2", city=None
+        )
+        self._create_business(
+            SparseBusinessDraft, sqlmodel_session, business_id=3, business_name="B3", city="City"
+        )
+
+        with pytest.raises(IntegrityError):
+            self._create_business(
+                SparseBusinessDraft, sqlmodel_session, business_id=4, business_name="B4", city="City"
+            )
+
+    def test_partial_storage_options(self, sqlmodel_session: Session):
+        """Test that storage options are applied to the partial table only."""
+
+        options = sqlmodel_session.execute(
+            text(
+                "SELECT relname, relpersistence, reloptions FROM pg_class "
+                "WHERE relname IN ('tuned_business_draft', 'business') ORDER BY relname"
+            )
+        ).all()
+
+        assert options == [
+            ("business", "p", None),
+            (
+                "tuned_business_draft",
+                "u",
+                ["fillfactor=70", "autovacuum_vacuum_scale_factor=0.01", "autovacuum_enabled=true"],
+            ),
+        ]
+
+    def test_partitioned_partial_table(self, sqlmodel_session: Session):
+        """Test that partitions inherit the nullability, indexes, trigger and storage options."""
+
+        partitions = sqlmodel_session.execute(
+            text(
+                "SELECT child.relname, child.reloptions FROM pg_inherits "
+                "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'tenant_business_draft'::regclass ORDER BY child.relname"
+            )
+        ).all()
+
+        assert partitions == [
+            ("tenant_business_draft_acme", ["fillfactor=70"]),
+            ("tenant_business_draft_globex", ["fillfactor=70"]),
+            ("tenant_business_draft_other", ["fillfactor=70"]),
+        ]
+
+        nullable = sqlmodel_session.execute(
+            text(
+                "SELECT attname, NOT attnotnull FROM pg_attribute "
+                "WHERE attrelid = 'tenant_business_draft_other'::regclass "
+                "AND attname IN ('business_name', 'city', 'address') ORDER BY attname"
+            )
+        ).all()
+
+        assert nullable == [("address", True), ("business_name", False), ("city", True)]
+        assert (
+            sqlmodel_session.execute(
+                text(
+                    "SELECT indexdef FROM pg_indexes WHERE indexname = 'tenant_business_draft_other_address_idx'"
+                )
+            )
+            .scalar_one()
+            .endswith("WHERE (address IS NOT NULL)")
+        )
+
+        sqlmodel_session.execute(
+            insert(TenantBusinessDraft.__table__).values(
+                tenant="initech", business_id=1, business_name="Business 1", address="Address 1"
+            )
+        )
+
+        assert (
+            sqlmodel_session.execute(text("SELECT filled_mask FROM tenant_business_draft_other")).scalar_one()
+            == 0b10
+        )
@@ -0,0 +1,65 @@
+import pytest
+
+from partial_tables import async_completion_stats, completion_stats
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+
+
+class TestCompletionStats:
+    """Test the single-scan completion statistics."""
+
+    def _add_drafts(self, business_pair: BusinessPair) -> None:
+        """Add four drafts with different fields filled."""
+
+        draft_model, _, session = business_pair
+        session.add_all(
+            [
+                draft_model(business_id=1, business_name="Tenant A", city="City 1", address="Address 1"),
+                draft_model(business_id=2, business_name="Tenant A", city="City 2", address=None),
+                draft_model(business_id=3, business_name="Tenant B", city=None, address=None),
+                draft_model(business_id=4, business_name="Tenant B", city="City 4", address="Address 4"),
+            ]
+        )
+        session.commit()
+
+    def test_counts_filled_fields(self, business_pair: BusinessPair):
+        """Test that each PartialAllowed field's fill count and rate are reported."""
+
+        draft_model, _, session = business_pair
+        self._add_drafts(business_pair)
+
+        report = completion_stats(session, draft_model)
+
+        assert (report.rows, report.complete, report.complete_rate) == (4, 2, 0.5)
+        assert [(field.name, field.filled, field.fill_rate) for field in report.fields] == [
+            ("city", 3, 0.75),
+            ("address", 2, 0.5),
+        ]
+        assert report.sample_percent is None
+
+    def test_where_and_sample(self, business_pair: BusinessPair):
+        """Test that the where filter and a full TABLESAMPLE narrow and keep the counted rows."""
+
+        draft_model, _, session = business_pair
+        self._add_drafts(business_pair)
+
+        report = completion_stats(
+            session, draft_model, where=draft_model.business_name == "Tenant A", sample_percent=100
+        )
+
+        assert (report.rows, report.complete, report.sample_percent) == (2, 1, 100)
+        assert [field.filled for field in report.fields] == [2, 1]
+
+        with pytest.raises(ValueError):
+            completion_stats(session, draft_model, sample_percent=0)
+
+    @pytest.mark.asyncio
+    async def test_async_completion_stats(self, async_business_pair: AsyncBusinessPair):
+        """Test that async_completion_stats counts the same as the sync version."""
+
+        draft_model, _, session = async_business_pair
+        session.add(draft_model(business_id=1, business_name="Business 1", city="City 1", address=None))
+        await session.commit()
+
+        report = await async_completion_stats(session, draft_model)
+
+        assert [field.filled for field in report.fields] == [1, 0]
@@ -0,0 +1,115 @@
+import pytest
+from sqlalchemy import event, func, select
+
+from partial_tables import PromotionMode, submit_for_promotion
+from tests.integration.conftest import AsyncBusinessPair, BusinessPair
+
+
+class TestSubmitForPromotion:
+    """Test the promotion of submitted drafts when their session flushes."""
+
+    def _draft(self, draft_model: type, key: int, **values: object) -> object:
+        """Build a complete draft."""
+
+        return draft_model(
+            **{
+                "business_id": key,
+                "business_name": f"Business {key}",
+                "city": f"City {key}",
+                "address": "Address",
+            }
+            | values
+        )
+
+    def test_promotes_submitted_drafts_with_one_statement(self, business_pair: BusinessPair):
+        """Test that every submitted draft is promoted and deleted by one statement each at flush."""
+
+        draft_model, complete_model, session = business_pair
+        statements = []
+
+        def record(_connection, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(session.get_bind(), "before_cursor_execute", record)
+
+        try:
+            for key in range(1, 101):
+                submit_for_promotion(session, self._draft(draft_model, key), complete_model)
+
+            session.commit()
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", record)
+
+        assert session.scalar(select(func.count()).select_from(complete_model)) == 100
+        assert session.scalar(select(func.count()).select_from(draft_model)) == 0
+        assert sum(statement.startswith("INSERT INTO business ") for statement in statements) == 1
+        assert sum(statement.startswith("DELETE FROM business_draft ") for statement in statements) == 1
+        assert not any(isinstance(instance, draft_model) for instance in session)
+
+    def test_submits_loaded_drafts(self, business_pair: BusinessPair):
+        """Test that unchanged drafts loaded from the database are promoted and can be kept."""
+
+        draft_model, complete_model, session = business_pair
+        session.add_all([self._draft(draft_model, 1), self._draft(draft_model, 2)])
+        session.commit()
+
+        submit_for_promotion(session, session.get(draft_model, 1), complete_model, delete_draft=False)
+        session.flush()
+
+        assert session.scalars(select(complete_model.business_id)).all() == [1]
+        assert session.get(draft_model, 1) is not None
+
+    def test_upserts_submitted_drafts(self, business_pair: BusinessPair):
+        """Test that UPSERT mode rewrites the published rows of submitted drafts."""
+
+        draft_model, complete_model, session = business_pair
+        session.add(complete_model(business_id=1, business_name="Old", city="City 1", address="Address"))
+        session.commit()
+
+        submit_for_promotion(
+            session, self._draft(draft_model, 1, business_name="New"), complete_model, PromotionMode.UPSERT
+        )
+        session.commit()
+
+        assert session.scalar(select(complete_model.business_name)) == "New"
+
+    def test_rejects_incomplete_drafts(self, business_pair: BusinessPair):
+        """Test that a flush with an incomplete submitted draft fails and discards the submissions."""
+
+        draft_model, complete_model, session = business_pair
+        submit_for_promotion(session, self._draft(draft_model, 1, city=None), complete_model)
+
+        with pytest.raises(ValueError, match="missing \\('city',\\)"):
+            session.flush()
+
+        session.rollback()
+        session.commit()
+
+        assert session.scalar(select(func.count()).select_from(complete_model)) == 0
+
+    def test_skips_drafts_deleted_after_submission(self, business_pair: BusinessPair):
+        """Test that a draft deleted before the flush is not promoted."""
+
+        draft_model, complete_model, session = business_pair
+        draft = self._draft(draft_model, 1)
+        session.add(draft)
+        session.commit()
+
+        submit_for_promotion(session, draft, complete_model)
+        session.delete(draft)
+        session.commit()
+
+        assert session.scalar(select(func.count()).select_from(complete_model)) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_session(self, async_business_pair: AsyncBusinessPair, business_pair: BusinessPair):
+        """Test that drafts submitted to an async session are promoted when it commits."""
+
+        draft_model, complete_model, session = async_business_pair
+
+        for key in (1, 2):
+            submit_for_promotion(session, self._draft(draft_model, key), complete_model)
+
+        await session.commit()
+
+        assert await session.scalar(select(func.count()).select_from(complete_model)) == 2
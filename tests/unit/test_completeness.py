@@ -0,0 +1,52 @@
+import pytest
+
+from partial_tables import completeness_checker
+from tests.integration.database.sqlalchemy_tables import Business, BusinessDraft
+from tests.integration.database.sqlmodel_tables import BusinessDraft as SQLModelBusinessDraft
+
+
+class TestCompletenessChecker:
+    """Test the precompiled in-process completeness checks."""
+
+    def test_checks_single_instances(self):
+        """Test that an instance's missing PartialAllowed fields are reported."""
+
+        checker = completeness_checker(BusinessDraft)
+        draft = BusinessDraft(business_id=1, business_name="Business 1", city="City 1")
+
+        assert checker.is_complete(draft) is False
+        assert checker.missing_fields(draft) == ("address",)
+
+        draft.address = "Address 1"
+
+        assert checker.is_complete(draft) is True
+        assert checker.missing_fields(draft) == ()
+
+    def test_checker_is_cached(self):
+        """Test that each model builds its checker once."""
+
+        assert completeness_checker(SQLModelBusinessDraft) is completeness_checker(SQLModelBusinessDraft)
+
+    def test_complete_mask_of_instances_and_tuples(self):
+        """Test that the batch mask works on instances and on tuples with a column layout."""
+
+        checker = completeness_checker(SQLModelBusinessDraft)
+        drafts = [
+            SQLModelBusinessDraft(
+                business_id=1, business_name="Business 1", city="City 1", address="Address 1"
+            ),
+            SQLModelBusinessDraft(business_id=2, business_name="Business 2", city=None, address="Address 2"),
+        ]
+        rows = [(1, "City 1", None), (2, "City 2", "Address 2")]
+
+        assert checker.complete_mask(drafts) == [True, False]
+        assert checker.complete_mask(iter(rows), columns=("business_id", "city", "address")) == [False, True]
+
+        with pytest.raises(ValueError):
+            checker.complete_mask(rows, columns=("business_id", "city"))
+
+    def test_rejects_complete_tables(self):
+        """Test that a non-partial table has no checker."""
+
+        with pytest.raises(ValueError):
+            completeness_checker(Business)
@@ -0,0 +1,104 @@
+from typing import Annotated
+
+import pytest
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column, registry
+from sqlmodel import Field, SQLModel
+
+from partial_tables import (
+    PartialAllowed,
+    PartialSQLAlchemyMixin,
+    PartialSQLModelMixin,
+    PartialTable,
+    make_partial,
+)
+from tests.integration.database import sqlmodel_tables
+
+
+class TenantBase(DeclarativeBase):
+    """Declarative base of the per-tenant tables, kept apart from the integration tables."""
+
+
+class TenantBusinessBase(PartialSQLAlchemyMixin, TenantBase):
+    """Business columns shared by every tenant."""
+
+    __abstract__ = True
+    __table_args__ = {"comment": "tenant business"}
+
+    business_id: Mapped[int] = mapped_column(primary_key=True)
+    city: Mapped[Annotated[str, PartialAllowed()]] = mapped_column(unique=True)
+
+
+class DeclaredTenantBusinessBase(PartialSQLAlchemyMixin, TenantBase):
+    """Business columns whose table arguments are computed per table."""
+
+    __abstract__ = True
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple:
+        return ({"comment": f"{cls.__tablename__} business"},)
+
+    business_id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class FactoryModel(SQLModel, registry=registry()):
+    """SQLModel base with its own metadata, so that factory tables stay out of the integration tables."""
+
+
+class FactoryBusinessBase(PartialSQLModelMixin, FactoryModel):
+    """SQLModel business columns shared by the factory tables."""
+
+    business_id: int = Field(primary_key=True)
+    business_name: str
+    city: Annotated[str, PartialAllowed()]
+
+
+class TestMakePartial:
+    """Test the cached partial table factory."""
+
+    def test_builds_partial_table_in_schema(self):
+        """Test that the factory builds a partial table in the requested schema."""
+
+        model = make_partial(TenantBusinessBase, "business_draft", schema="tenant_a")
+        table = model.__table__
+
+        assert issubclass(model, PartialTable)
+        assert table.fullname == "tenant_a.business_draft"
+        assert table.comment == "tenant business"
+        assert table.c.city.nullable is True
+        assert table.c.city.unique is True
+        assert model.__partial_fields__ == ("city",)
+
+    def test_returns_cached_class(self):
+        """Test that asking for the same table twice returns the same class."""
+
+        model = make_partial(TenantBusinessBase, "business_draft", schema="tenant_b")
+
+        assert make_partial(TenantBusinessBase, "business_draft", schema="tenant_b") is model
+        assert make_partial(TenantBusinessBase, "business_draft", schema="tenant_c") is not model
+
+    def test_builds_sqlmodel_partial_table(self):
+        """Test that the factory maps SQLModel partial tables."""
+
+        model = make_partial(FactoryBusinessBase, "factory_business_draft")
+
+        assert model.__table__.metadata is FactoryModel.metadata
+        assert "factory_business_draft" not in SQLModel.metadata.tables
+        assert model.__table__.c.city.nullable is True
+        assert model(business_id=1, business_name="Business 1").city is None
+
+    def test_builds_partial_table_in_schema_with_declared_table_args(self):
+        """Test that table arguments computed by a declared_attr are placed in the requested schema."""
+
+        model = make_partial(DeclaredTenantBusinessBase, "declared_business_draft", schema="tenant_a")
+
+        assert model.__table__.fullname == "tenant_a.declared_business_draft"
+        assert model.__table__.comment == "declared_business_draft business"
+
+    def test_rejects_non_partial_bases(self):
+        """Test that bases without a partial table mixin or that are already partial are rejected."""
+
+        with pytest.raises(ValueError):
+            make_partial(TenantBase, "business_draft")
+
+        with pytest.raises(ValueError):
+            make_partial(sqlmodel_tables.BusinessDraft, "business_draft_copy")
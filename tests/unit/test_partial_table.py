@@ -0,0 +1,267 @@
+from datetime import date
+from types import ModuleType
+from typing import Annotated, Optional
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from partial_tables import (
+    PartialAllowed,
+    PartialPartition,
+    PartialPartitioning,
+    PartialSQLAlchemyMixin,
+    PartialStorage,
+    PartialTable,
+    PartitionMethod,
+    partition_clause,
+)
+from partial_tables.annotations import rewrite_type_hints, rewrite_with_optional
+from partial_tables.ddl import partition_bound
+from tests.integration.database import sqlalchemy_tables, sqlmodel_tables
+
+MARKER = PartialAllowed()
+
+PartialStr = Annotated[str, MARKER]
+
+# A user types module whose alias is only reachable as ptypes.PartialText.
+ptypes = ModuleType("ptypes")
+ptypes.PartialText = Annotated[str, MARKER]
+
+
+class StringAnnotatedBase:
+    """Class whose annotations are strings, as with `from __future__ import annotations`."""
+
+    undefined: "NotDefinedAnywhere"
+    city: "Annotated[str, MARKER]"
+    address: "PartialStr"
+    name: "str"
+
+
+class StringAnnotatedDraft(StringAnnotatedBase):
+    """Subclass that adds one partial annotation of its own."""
+
+    zip_code: "Annotated[int, MARKER]"
+
+
+class TestRewriteWithOptional:
+    """Test the annotation rewrite used by the partial table mixins."""
+
+    def test_rewrites_partial_allowed_to_optional(self):
+        """Test that an annotation marked with PartialAllowed becomes Optional."""
+
+        marker = PartialAllowed()
+
+        assert rewrite_with_optional(Annotated[str, marker]) == Annotated[Optional[str], marker]
+        assert rewrite_with_optional(list[Annotated[int, marker]]) == list[Annotated[Optional[int], marker]]
+
+    def test_repeated_rewrite_returns_cached_annotation(self):
+        """Test that rewriting the same annotation twice returns the same object."""
+
+        ann = Annotated[str, PartialAllowed()]
+
+        assert rewrite_with_optional(ann) is rewrite_with_optional(ann)
+
+    def test_unchanged_annotation_keeps_its_identity(self):
+        """Test that an annotation without PartialAllowed is returned as-is even when an equal one is cached."""
+
+        cached = list[Annotated[int, "meta"]]
+        equal = list[Annotated[int, "meta"]]
+
+        assert rewrite_with_optional(cached) is cached
+        assert rewrite_with_optional(equal) is equal
+
+    def test_unhashable_metadata_is_rewritten(self):
+        """Test that annotations with unhashable metadata are still rewritten."""
+
+        marker = PartialAllowed()
+        ann = Annotated[str, marker, ["unhashable"]]
+
+        assert rewrite_with_optional(ann) == Annotated[Optional[str], marker, ["unhashable"]]
+
+    def test_sibling_partial_tables_share_rewritten_annotations(self):
+        """Test that partial tables built from the same base reuse the base's rewritten annotations."""
+
+        for module in (sqlalchemy_tables, sqlmodel_tables):
+            draft_annotations = module.BusinessDraft.__annotations__
+            indexed_annotations = module.IndexedBusinessDraft.__annotations__
+
+            assert draft_annotations["city"] is indexed_annotations["city"]
+            assert draft_annotations["address"] is indexed_annotations["address"]
+
+
+class TestRewriteTypeHints:
+    """Test the per-class rewrite of type hints used by the partial table mixins."""
+
+    def test_only_partial_string_annotations_are_evaluated(self):
+        """Test that unresolvable annotations without PartialAllowed are never evaluated."""
+
+        assert rewrite_type_hints(StringAnnotatedDraft) == {
+            "city": Annotated[Optional[str], MARKER],
+            "address": Annotated[Optional[str], MARKER],
+            "zip_code": Annotated[Optional[int], MARKER],
+        }
+
+    def test_module_qualified_alias_is_rewritten(self):
+        """Test that a partial alias referenced through its module makes the column nullable."""
+
+        class Base(DeclarativeBase):
+            pass
+
+        class QualifiedDraft(PartialSQLAlchemyMixin, Base, PartialTable):
+            __tablename__ = "qualified_business_draft"
+
+            business_id: "Mapped[int]" = mapped_column(primary_key=True)
+            city: "Mapped[ptypes.PartialText]"
+            name: "Mapped[str]"
+
+        assert QualifiedDraft.__partial_fields__ == ("city",)
+        assert QualifiedDraft.__table__.c.city.nullable
+        assert not QualifiedDraft.__table__.c.name.nullable
+
+    def test_subclass_reuses_base_rewrites(self):
+        """Test that a subclass gets the rewritten annotations computed for its base."""
+
+        base_rewrites = rewrite_type_hints(StringAnnotatedBase)
+        draft_rewrites = rewrite_type_hints(StringAnnotatedDraft)
+
+        assert draft_rewrites["city"] is base_rewrites["city"]
+        assert draft_rewrites["address"] is base_rewrites["address"]
+
+
+class TestPartialStorage:
+    """Test the storage options of partial tables."""
+
+    def test_renders_storage_parameters(self):
+        """Test that fillfactor and autovacuum settings are rendered as storage parameters."""
+
+        storage = PartialStorage(fillfactor=80, autovacuum={"enabled": False, "vacuum_threshold": 100})
+
+        assert storage.storage_parameters() == {
+            "fillfactor": "80",
+            "autovacuum_enabled": "false",
+            "autovacuum_vacuum_threshold": "100",
+        }
+
+    def test_rejects_unsafe_parameter_names(self):
+        """Test that autovacuum names that are not plain identifiers are rejected."""
+
+        with pytest.raises(ValidationError):
+            PartialStorage(autovacuum={"enabled = true); DROP TABLE business; --": 1})
+
+
+class TestPartialPartitioning:
+    """Test the partitioning options of partial tables."""
+
+    def test_renders_partition_bounds(self):
+        """Test that each partitioning method renders its partition bound."""
+
+        assert (
+            partition_bound(PartitionMethod.LIST, PartialPartition(name="a", values=["o'k", "50%", None]))
+            == "FOR VALUES IN ('o''k', '50%', NULL)"
+        )
+        assert (
+            partition_bound(PartitionMethod.RANGE, PartialPartition(name="y2024", start=date(2024, 1, 1)))
+            == "FOR VALUES FROM ('2024-01-01') TO (MAXVALUE)"
+        )
+        assert (
+            partition_bound(PartitionMethod.HASH, PartialPartition(name="h1", modulus=4, remainder=1))
+            == "FOR VALUES WITH (MODULUS 4, REMAINDER 1)"
+        )
+        assert (
+            partition_bound(PartitionMethod.LIST, PartialPartition(name="other", default=True)) == "DEFAULT"
+        )
+
+    @pytest.mark.parametrize(
+        "partitions",
+        [
+            [PartialPartition(name="a")],
+            [PartialPartition(name="a", values=[1]), PartialPartition(name="a", values=[2])],
+            [PartialPartition(name="a", default=True), PartialPartition(name="b", default=True)],
+        ],
+    )
+    def test_rejects_invalid_list_partitions(self, partitions: list[PartialPartition]):
+        """Test that list partitions without values, or with clashing names or defaults, are rejected."""
+
+        with pytest.raises(ValidationError):
+            PartialPartitioning(method=PartitionMethod.LIST, column="tenant", partitions=partitions)
+
+    def test_rejects_invalid_hash_partitions(self):
+        """Test that hash partitions need a remainder lower than their modulus."""
+
+        with pytest.raises(ValidationError):
+            PartialPartitioning(
+                method=PartitionMethod.HASH,
+                column="business_id",
+                partitions=[PartialPartition(name="h", modulus=2, remainder=2)],
+            )
+
+    def test_requires_partition_key_in_primary_key(self):
+        """Test that partitioning by a column outside the primary key is rejected."""
+
+        class Base(DeclarativeBase):
+            pass
+
+        with pytest.raises(ValueError, match="primary key"):
+
+            class _Draft(PartialSQLAlchemyMixin, Base, PartialTable):
+                __tablename__ = "unkeyed_business_draft"
+                __partial_partitioning__ = PartialPartitioning(method=PartitionMethod.HASH, column="city")
+
+                business_id: Mapped[int] = mapped_column(primary_key=True)
+                city: Mapped[Annotated[str, PartialAllowed()]]
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_requires_partition_key_in_unique_indexes(self, sparse: bool):
+        """Test that unique constraints and sparse unique indexes must include the partition key."""
+
+        class Base(DeclarativeBase):
+            pass
+
+        with pytest.raises(ValueError, match=r"unique index or constraint on \(city\)"):
+
+            class _Draft(PartialSQLAlchemyMixin, Base, PartialTable):
+                __tablename__ = "unique_business_draft"
+                __partial_sparse_indexes__ = sparse
+                __partial_partitioning__ = PartialPartitioning(
+                    method=PartitionMethod.HASH,
+                    column="tenant",
+                    partitions=[PartialPartition(name="h0", modulus=1, remainder=0)],
+                )
+
+                tenant: Mapped[str] = mapped_column(primary_key=True)
+                business_id: Mapped[int] = mapped_column(primary_key=True)
+                city: Mapped[Annotated[str, PartialAllowed()]] = mapped_column(unique=True)
+
+    def test_default_range_partition_clause_matches_the_gaps(self):
+        """Test that the default range partition clause compares the key with the gaps between partitions."""
+
+        class Base(DeclarativeBase):
+            pass
+
+        class _Draft(PartialSQLAlchemyMixin, Base, PartialTable):
+            __tablename__ = "dated_business_draft"
+            __partial_partitioning__ = PartialPartitioning(
+                method=PartitionMethod.RANGE,
+                column="day",
+                partitions=[
+                    PartialPartition(name="y2024", start=date(2024, 1, 1), end=date(2025, 1, 1)),
+                    PartialPartition(name="old", end=date(2023, 1, 1)),
+                    PartialPartition(name="other", default=True),
+                ],
+            )
+
+            business_id: Mapped[int] = mapped_column(primary_key=True)
+            day: Mapped[date] = mapped_column(primary_key=True)
+
+        clause = partition_clause(_Draft, "other").compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+
+        assert str(clause) == (
+            "dated_business_draft.day IS NULL"
+            " OR dated_business_draft.day IS NOT NULL"
+            " AND dated_business_draft.day >= '2023-01-01' AND dated_business_draft.day < '2024-01-01'"
+            " OR dated_business_draft.day IS NOT NULL AND dated_business_draft.day >= '2025-01-01'"
+        )